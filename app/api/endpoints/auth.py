@@ -7,6 +7,7 @@ recuperação de senha e gerenciamento de usuários e papéis.
 
 from typing import List, Dict, Any
 from fastapi import APIRouter, Depends, HTTPException, status, Request, Body
+from fastapi.responses import ORJSONResponse
 from fastapi.security import OAuth2PasswordRequestForm
 
 from app.schemas.auth import (
@@ -19,9 +20,10 @@ from app.schemas.auth import (
     UpdateRoleRequest,
     UserResponse,
     UserDetailResponse,
-    UserListResponse
+    UserListResponse,
+    USER_LIST_ADAPTER
 )
-from app.models.user import UserCreate, UserRole, Permission, ROLE_PERMISSIONS
+from app.models.user import UserCreate, UserRole, Permission, ROLE_PERMISSION_STRINGS
 from app.services.auth_service import (
     create_user,
     login,
@@ -76,7 +78,7 @@ async def register_user(
     
     # Converte o modelo de usuário para o schema de resposta
     return {
-        "_id": str(user.id),
+        "id": str(user.id),
         "name": user.name,
         "email": user.email,
         "role": user.role.value,
@@ -232,11 +234,11 @@ async def get_current_user_profile(
     Retorna os dados completos do usuário, incluindo papel e permissões.
     """
     # Obtém as permissões do usuário
-    permissions = [p.value for p in ROLE_PERMISSIONS.get(current_user.role, [])]
+    permissions = ROLE_PERMISSION_STRINGS.get(current_user.role, ())
     
     # Retorna os dados do usuário atual
     return {
-        "_id": str(current_user.id),
+        "id": str(current_user.id),
         "name": current_user.name,
         "email": current_user.email,
         "role": current_user.role.value,
@@ -291,10 +293,11 @@ async def list_users(
         role_filter=role_filter
     )
     
-    # Converte a lista para o formato de resposta
-    user_list = [
+    # Converte a lista para o formato de resposta, validando e serializando o
+    # lote de uma só vez
+    user_list = USER_LIST_ADAPTER.validate_python([
         {
-            "_id": str(user.id),
+            "id": str(user.id),
             "name": user.name,
             "email": user.email,
             "role": user.role.value,
@@ -302,12 +305,12 @@ async def list_users(
             "created_at": user.created_at
         }
         for user in users
-    ]
+    ])
     
-    return {
+    return ORJSONResponse({
         "total": len(user_list),
-        "users": user_list
-    }
+        "users": USER_LIST_ADAPTER.dump_python(user_list)
+    })
 
 
 @router.get("/users/{user_id}", response_model=UserDetailResponse)
@@ -334,11 +337,11 @@ async def get_user_profile(
         )
     
     # Obtém as permissões do usuário
-    permissions = [p.value for p in ROLE_PERMISSIONS.get(user.role, [])]
+    permissions = ROLE_PERMISSION_STRINGS.get(user.role, ())
     
     # Retorna os dados do usuário
     return {
-        "_id": str(user.id),
+        "id": str(user.id),
         "name": user.name,
         "email": user.email,
         "role": user.role.value,
@@ -381,15 +384,15 @@ async def update_user_role_endpoint(
         db=db,
         user_id=user_id,
         new_role=new_role,
-        admin_user_id=str(current_user.id)
+        admin_user=current_user
     )
     
     # Obtém as permissões do usuário
-    permissions = [p.value for p in ROLE_PERMISSIONS.get(updated_user.role, [])]
+    permissions = ROLE_PERMISSION_STRINGS.get(updated_user.role, ())
     
     # Retorna os dados atualizados do usuário
     return {
-        "_id": str(updated_user.id),
+        "id": str(updated_user.id),
         "name": updated_user.name,
         "email": updated_user.email,
         "role": updated_user.role.value,
@@ -437,15 +440,15 @@ async def update_user_status(
         db=db,
         user_id=user_id,
         is_active=is_active,
-        admin_user_id=str(current_user.id)
+        admin_user=current_user
     )
     
     # Obtém as permissões do usuário
-    permissions = [p.value for p in ROLE_PERMISSIONS.get(updated_user.role, [])]
+    permissions = ROLE_PERMISSION_STRINGS.get(updated_user.role, ())
     
     # Retorna os dados atualizados do usuário
     return {
-        "_id": str(updated_user.id),
+        "id": str(updated_user.id),
         "name": updated_user.name,
         "email": updated_user.email,
         "role": updated_user.role.value,
@@ -6,7 +6,9 @@ cenários financeiros baseados em dados processados de planilhas Excel.
 """
 
 from fastapi import APIRouter, HTTPException, status, Depends, Body, Path, Query
+from fastapi.responses import ORJSONResponse
 from typing import Dict, List, Any, Optional
+from dataclasses import asdict
 from datetime import datetime
 from bson import ObjectId
 
@@ -15,7 +17,8 @@ from app.schemas.scenarios import (
     ScenarioResponse,
     ScenarioListResponse,
     ScenarioType,
-    ScenarioMetrics
+    ScenarioMetrics,
+    SCENARIO_LIST_ADAPTER
 )
 from app.models.user import UserInDB
 from app.db.mongodb import get_database
@@ -117,7 +120,7 @@ async def create_scenario(
             "financial_data_id": scenario_data.financial_data_id,
             "parameters": generator_params,
             "data": result["data"],
-            "metrics": scenario_metrics.dict(),
+            "metrics": asdict(scenario_metrics),
             "created_at": now,
             "updated_at": now,
             "user_id": str(current_user.id)
@@ -187,17 +190,26 @@ async def list_scenarios(
     if financial_data_id:
         query["financial_data_id"] = financial_data_id
     
-    # Conta o total de documentos
-    total = await db["scenarios"].count_documents(query)
-    
-    # Obtém os documentos com paginação
-    cursor = db["scenarios"].find(query).sort("created_at", -1).skip(skip).limit(limit)
-    scenarios = await cursor.to_list(length=limit)
+    # Obtém a página e o total em uma única ida ao banco
+    pipeline = [
+        {"$match": query},
+        {"$facet": {
+            "rows": [
+                {"$sort": {"created_at": -1}},
+                {"$skip": skip},
+                {"$limit": limit}
+            ],
+            "meta": [{"$count": "total"}]
+        }}
+    ]
+    facet = await db["scenarios"].aggregate(pipeline).to_list(length=1)
+    scenarios = facet[0]["rows"] if facet else []
+    meta = facet[0]["meta"] if facet else []
+    total = meta[0]["total"] if meta else 0
     
-    # Formata a resposta
-    scenario_list = []
-    for scenario in scenarios:
-        scenario_list.append({
+    # Formata a resposta, validando e serializando o lote de uma só vez
+    scenario_list = SCENARIO_LIST_ADAPTER.validate_python([
+        {
             "id": str(scenario["_id"]),
             "title": scenario["title"],
             "description": scenario.get("description"),
@@ -207,12 +219,14 @@ async def list_scenarios(
             "financial_data_id": scenario["financial_data_id"],
             "metrics": scenario["metrics"],
             "parameters": scenario.get("parameters")
-        })
+        }
+        for scenario in scenarios
+    ])
     
-    return {
+    return ORJSONResponse({
         "total": total,
-        "scenarios": scenario_list
-    }
+        "scenarios": SCENARIO_LIST_ADAPTER.dump_python(scenario_list)
+    })
 
 
 @router.get("/{scenario_id}", response_model=ScenarioResponse)
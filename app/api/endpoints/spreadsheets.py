@@ -6,8 +6,8 @@ essenciais para a geração de cenários financeiros.
 """
 
 from typing import Any, List, Dict, Optional
-from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, status, Query, Path, Form, BackgroundTasks
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, status, Query, Path, Form, BackgroundTasks, Response
+from fastapi.responses import FileResponse, JSONResponse, ORJSONResponse
 from motor.motor_asyncio import AsyncIOMotorClient
 from bson import ObjectId
 import os
@@ -27,7 +27,9 @@ from app.schemas.spreadsheets import (
     SpreadsheetUploadResponse,
     SpreadsheetProcessResponse,
     SpreadsheetListResponse,
-    CategoryInfo
+    CategoryInfo,
+    SPREADSHEET_UPLOAD_ADAPTER,
+    SPREADSHEET_LIST_ADAPTER
 )
 from app.db.mongodb import get_database
 from app.utils.security import get_current_active_user, require_permission
@@ -115,7 +117,11 @@ async def upload_spreadsheet(
         "description": description
     }
     
-    return response
+    return Response(
+        content=SPREADSHEET_UPLOAD_ADAPTER.dump_json(SPREADSHEET_UPLOAD_ADAPTER.validate_python(response)),
+        media_type="application/json",
+        status_code=status.HTTP_201_CREATED
+    )
 
 
 @router.post("/{spreadsheet_id}/process", response_model=SpreadsheetProcessResponse)
@@ -272,7 +278,12 @@ async def get_processed_data(db, spreadsheet_id: str, user_id: str) -> Dict[str,
     }
 
 
-@router.get("/", response_model=SpreadsheetListResponse)
+@router.get(
+    "/",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": SpreadsheetListResponse}}
+)
 async def list_spreadsheets(
     skip: int = Query(0, ge=0, description="Itens a pular (paginação)"),
     limit: int = Query(10, ge=1, le=100, description="Limite de itens a retornar"),
@@ -313,10 +324,9 @@ async def list_spreadsheets(
     cursor = db["spreadsheets"].find(query).sort("upload_date", -1).skip(skip).limit(limit)
     spreadsheets = await cursor.to_list(length=limit)
     
-    # Formata a resposta
-    spreadsheet_list = []
-    for sheet in spreadsheets:
-        spreadsheet_list.append({
+    # Formata a resposta, validando e serializando o lote de uma só vez
+    spreadsheet_list = SPREADSHEET_LIST_ADAPTER.validate_python([
+        {
             "id": str(sheet["_id"]),
             "filename": sheet["filename"],
             "upload_date": sheet["upload_date"],
@@ -325,12 +335,14 @@ async def list_spreadsheets(
             "message": "Planilha processada" if sheet.get("processed", False) else "Planilha não processada",
             "user_id": sheet["user_id"],
             "description": sheet.get("description")
-        })
+        }
+        for sheet in spreadsheets
+    ])
     
-    return {
+    return ORJSONResponse({
         "total": total,
-        "spreadsheets": spreadsheet_list
-    }
+        "spreadsheets": SPREADSHEET_LIST_ADAPTER.dump_python(spreadsheet_list)
+    })
 
 
 @router.get("/{spreadsheet_id}", response_model=SpreadsheetUploadResponse)
@@ -366,7 +378,7 @@ async def get_spreadsheet(
             detail="Sem permissão para acessar esta planilha"
         )
     
-    return {
+    response = SPREADSHEET_UPLOAD_ADAPTER.validate_python({
         "id": str(spreadsheet["_id"]),
         "filename": spreadsheet["filename"],
         "upload_date": spreadsheet["upload_date"],
@@ -375,7 +387,12 @@ async def get_spreadsheet(
         "message": "Planilha processada" if spreadsheet.get("processed", False) else "Planilha não processada",
         "user_id": spreadsheet["user_id"],
         "description": spreadsheet.get("description")
-    }
+    })
+    
+    return Response(
+        content=SPREADSHEET_UPLOAD_ADAPTER.dump_json(response),
+        media_type="application/json"
+    )
 
 
 @router.delete("/{spreadsheet_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -11,7 +11,7 @@ from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 from pymongo.errors import ServerSelectionTimeoutError, ConnectionFailure
 
 from app.core.config import settings
-from app.models.user import user_indexes
+from app.models.user import user_indexes, password_reset_indexes
 from app.models.financial import financial_data_indexes
 from app.models.scenario import scenario_indexes
 
@@ -54,6 +54,9 @@ async def connect_to_mongo() -> None:
         # Inicializa os índices
         await create_indexes()
         
+        # Converte o último login de usuários gravados antes de last_login_ts
+        await migrate_last_login_timestamps()
+        
     except (ServerSelectionTimeoutError, ConnectionFailure) as e:
         logger.error(f"Falha ao conectar ao MongoDB: {e}")
         raise ConnectionFailure(f"Falha ao conectar ao MongoDB: {e}")
@@ -83,6 +86,7 @@ async def create_indexes() -> None:
     # Dicionário de coleções e seus índices
     collections_indexes = {
         "users": user_indexes,
+        "password_resets": password_reset_indexes,
         "financial_data": financial_data_indexes, 
         "scenarios": scenario_indexes
     }
@@ -91,15 +95,38 @@ async def create_indexes() -> None:
         try:
             collection = db[collection_name]
             
-            # Cria cada índice definido para a coleção
-            for index in indexes:
-                await collection.create_index(index.document)
+            # Cria todos os índices definidos para a coleção em um único comando
+            await collection.create_indexes(indexes)
             
             logger.info(f"Índices criados para coleção {collection_name}")
         except Exception as e:
             logger.error(f"Erro ao criar índices para {collection_name}: {e}")
 
 
+async def migrate_last_login_timestamps() -> None:
+    """
+    Preenche last_login_ts a partir do campo antigo last_login dos usuários.
+    
+    Usuários gravados antes da troca para segundos desde a época Unix só têm
+    last_login (datetime). A atualização usa um único $set em pipeline no
+    servidor e só alcança documentos ainda sem last_login_ts, então pode ser
+    executada a cada inicialização sem efeito nos já migrados.
+    """
+    if db is None:
+        logger.error("Tentativa de migrar last_login sem conexão ao MongoDB")
+        return
+    
+    try:
+        result = await db["users"].update_many(
+            {"last_login": {"$type": "date"}, "last_login_ts": {"$exists": False}},
+            [{"$set": {"last_login_ts": {"$toLong": {"$divide": [{"$toLong": "$last_login"}, 1000]}}}}]
+        )
+        if result.modified_count:
+            logger.info(f"last_login_ts preenchido para {result.modified_count} usuários")
+    except Exception as e:
+        logger.error(f"Erro ao migrar last_login dos usuários: {e}")
+
+
 def get_db() -> AsyncIOMotorDatabase:
     """
     Retorna a instância do banco de dados MongoDB.
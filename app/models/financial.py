@@ -7,7 +7,7 @@ importados, com validação e relacionamento com usuários.
 
 from typing import Dict, List, Optional, Any
 from datetime import datetime
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, validator, ConfigDict
 from bson import ObjectId
 from pymongo import IndexModel, ASCENDING, DESCENDING
 
@@ -105,18 +105,16 @@ class FinancialDataInDB(FinancialDataBase):
         is_public: Indica se os dados são públicos.
         shared_with: Lista de IDs de usuários com quem os dados foram compartilhados.
     """
-    id: PyObjectId = Field(default_factory=PyObjectId, alias="_id")
+    id: PyObjectId = Field(default_factory=ObjectId, alias="_id")
     owner_id: PyObjectId
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
     is_public: bool = False
     shared_with: List[PyObjectId] = []
     
-    class Config:
-        populate_by_name = True
-        arbitrary_types_allowed = True
-        json_encoders = {ObjectId: str}
-        json_schema_extra = {
+    model_config = ConfigDict(
+        populate_by_name=True,
+        json_schema_extra={
             "example": {
                 "_id": "60d6e04aec32c02a5a7c7d40",
                 "title": "Dados financeiros Q2 2023",
@@ -127,6 +125,7 @@ class FinancialDataInDB(FinancialDataBase):
                 "updated_at": "2023-05-15T10:00:00"
             }
         }
+    )
 
     def can_user_access(self, user_id: ObjectId, user_role: UserRole) -> bool:
         """
@@ -178,9 +177,9 @@ class FinancialDataResponse(BaseModel):
     is_public: bool
     owner_id: str
     
-    class Config:
-        populate_by_name = True
-        json_schema_extra = {
+    model_config = ConfigDict(
+        populate_by_name=True,
+        json_schema_extra={
             "example": {
                 "_id": "60d6e04aec32c02a5a7c7d40",
                 "title": "Dados financeiros Q2 2023",
@@ -198,6 +197,7 @@ class FinancialDataResponse(BaseModel):
                 "owner_id": "60d6e04aec32c02a5a7c7d39"
             }
         }
+    )
 
 
 class FinancialDataResponseAdmin(FinancialDataResponse):
@@ -213,8 +213,8 @@ class FinancialDataResponseAdmin(FinancialDataResponse):
     metadata: FinancialMetadata
     shared_with: List[str] = []
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "_id": "60d6e04aec32c02a5a7c7d40",
                 "title": "Dados financeiros Q2 2023",
@@ -242,6 +242,7 @@ class FinancialDataResponseAdmin(FinancialDataResponse):
                 }
             }
         }
+    )
 
 
 # Configuração para índices no MongoDB
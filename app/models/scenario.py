@@ -8,7 +8,8 @@ gerados, com validação e relacionamento com dados financeiros e usuários.
 from typing import Dict, List, Optional, Any, Union
 from datetime import datetime
 from enum import Enum
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, validator, ConfigDict
+from pydantic.dataclasses import dataclass
 from bson import ObjectId
 from pymongo import IndexModel, ASCENDING, DESCENDING
 
@@ -48,10 +49,13 @@ class ScenarioParameter(BaseModel):
         return v
 
 
-class ScenarioMetrics(BaseModel):
+@dataclass(frozen=True, slots=True, config=ConfigDict(extra="forbid"))
+class ScenarioMetrics:
     """
     Métricas calculadas para um cenário financeiro.
     
+    Dataclass imutável com __slots__, sem __dict__ por instância.
+    
     Attributes:
         total_revenue: Receita total.
         total_costs: Custos totais.
@@ -146,7 +150,7 @@ class ScenarioInDB(ScenarioBase):
         is_favorite: Indica se o cenário é um favorito do proprietário.
         tags: Lista de tags para categorizar o cenário.
     """
-    id: PyObjectId = Field(default_factory=PyObjectId, alias="_id")
+    id: PyObjectId = Field(default_factory=ObjectId, alias="_id")
     owner_id: PyObjectId
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
@@ -155,11 +159,9 @@ class ScenarioInDB(ScenarioBase):
     is_favorite: bool = False
     tags: List[str] = []
     
-    class Config:
-        populate_by_name = True
-        arbitrary_types_allowed = True
-        json_encoders = {ObjectId: str}
-        json_schema_extra = {
+    model_config = ConfigDict(
+        populate_by_name=True,
+        json_schema_extra={
             "example": {
                 "_id": "60d6e04aec32c02a5a7c7d40",
                 "title": "Cenário Otimista Q2 2023",
@@ -174,6 +176,7 @@ class ScenarioInDB(ScenarioBase):
                 "tags": ["2023", "Q2", "otimista"]
             }
         }
+    )
 
     def can_user_access(self, user_id: ObjectId, user_role: UserRole) -> bool:
         """
@@ -237,7 +240,7 @@ class ScenarioResponse(BaseModel):
         is_favorite: Indica se o cenário é um favorito do proprietário.
         tags: Lista de tags para categorizar o cenário.
     """
-    id: str = Field(..., alias="_id")
+    id: str
     title: str
     description: Optional[str] = None
     scenario_type: ScenarioType
@@ -249,11 +252,10 @@ class ScenarioResponse(BaseModel):
     is_favorite: bool
     tags: List[str] = []
     
-    class Config:
-        populate_by_name = True
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
-                "_id": "60d6e04aec32c02a5a7c7d40",
+                "id": "60d6e04aec32c02a5a7c7d40",
                 "title": "Cenário Otimista Q2 2023",
                 "description": "Análise otimista para o segundo trimestre de 2023",
                 "scenario_type": "otimista",
@@ -275,6 +277,7 @@ class ScenarioResponse(BaseModel):
                 "tags": ["2023", "Q2", "otimista"]
             }
         }
+    )
 
 
 class ScenarioResponseDetail(ScenarioResponse):
@@ -288,10 +291,10 @@ class ScenarioResponseDetail(ScenarioResponse):
     parameters: Optional[ScenarioParameter] = None
     data: Dict[str, Any]
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
-                "_id": "60d6e04aec32c02a5a7c7d40",
+                "id": "60d6e04aec32c02a5a7c7d40",
                 "title": "Cenário Otimista Q2 2023",
                 "description": "Análise otimista para o segundo trimestre de 2023",
                 "scenario_type": "otimista",
@@ -319,6 +322,7 @@ class ScenarioResponseDetail(ScenarioResponse):
                 "tags": ["2023", "Q2", "otimista"]
             }
         }
+    )
 
 
 class ScenarioResponseAdmin(ScenarioResponseDetail):
@@ -332,10 +336,10 @@ class ScenarioResponseAdmin(ScenarioResponseDetail):
     updated_at: datetime
     shared_with: List[str] = []
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
-                "_id": "60d6e04aec32c02a5a7c7d40",
+                "id": "60d6e04aec32c02a5a7c7d40",
                 "title": "Cenário Otimista Q2 2023",
                 "description": "Análise otimista para o segundo trimestre de 2023",
                 "scenario_type": "otimista",
@@ -365,6 +369,7 @@ class ScenarioResponseAdmin(ScenarioResponseDetail):
                 "tags": ["2023", "Q2", "otimista"]
             }
         }
+    )
 
 
 # Configuração para índices no MongoDB
@@ -6,28 +6,42 @@ roles, permissões e métodos auxiliares para validação de acesso.
 """
 
 from enum import Enum
-from typing import Optional, List, Dict, Any
-from datetime import datetime
-from pydantic import BaseModel, EmailStr, Field, validator
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Union, Annotated
+from datetime import datetime, timezone
+from pydantic import BaseModel, EmailStr, Field, validator, ConfigDict, PlainSerializer, PlainValidator, WithJsonSchema
 from bson import ObjectId
 from pymongo import IndexModel, ASCENDING
 
-# Classes auxiliares para trabalhar com MongoDB e FastAPI
-class PyObjectId(ObjectId):
-    """Classe customizada para converter ObjectId para string e vice-versa."""
-    @classmethod
-    def __get_validators__(cls):
-        yield cls.validate
-        
-    @classmethod
-    def validate(cls, v):
-        if not ObjectId.is_valid(v):
-            raise ValueError("ID inválido")
-        return ObjectId(v)
+# Tipos auxiliares para trabalhar com MongoDB e FastAPI
+def _validate_object_id(value: Any) -> ObjectId:
+    """
+    Converte um ID recebido (ObjectId ou string) para ObjectId.
     
-    @classmethod
-    def __get_pydantic_json_schema__(cls, _schema_generator):
-        return {"type": "string"}
+    Args:
+        value: Valor a ser validado.
+        
+    Returns:
+        ObjectId correspondente.
+        
+    Raises:
+        ValueError: Se o valor não for um ObjectId válido.
+    """
+    if isinstance(value, ObjectId):
+        return value
+    if not ObjectId.is_valid(value):
+        raise ValueError("ID inválido")
+    return ObjectId(value)
+
+
+# ObjectId aceito como string e serializado como string no JSON; no modo
+# Python continua ObjectId, como esperado pelo MongoDB
+PyObjectId = Annotated[
+    ObjectId,
+    PlainValidator(_validate_object_id),
+    PlainSerializer(str, return_type=str, when_used="json"),
+    WithJsonSchema({"type": "string"}),
+]
 
 
 class UserRole(str, Enum):
@@ -74,6 +88,30 @@ ROLE_PERMISSIONS = {
     ]
 }
 
+# Valores textuais das permissões de cada papel, usados na emissão de tokens
+ROLE_PERMISSION_STRINGS = {
+    role: tuple(p.value for p in perms) for role, perms in ROLE_PERMISSIONS.items()
+}
+
+
+@lru_cache(maxsize=64)
+def _role_has(role: UserRole, permission: Permission, active: bool) -> bool:
+    """
+    Decide se um papel concede uma permissão, memorizando o resultado.
+    
+    O espaço de chaves é pequeno (papéis × permissões × status), então o
+    cache funciona como uma tabela estática após o aquecimento.
+    
+    Args:
+        role: Papel do usuário.
+        permission: Permissão a ser verificada.
+        active: Indica se o usuário está ativo.
+        
+    Returns:
+        True se o papel concede a permissão a um usuário ativo.
+    """
+    return active and permission in ROLE_PERMISSIONS.get(role, ())
+
 
 class UserBase(BaseModel):
     """
@@ -117,19 +155,17 @@ class UserInDB(UserBase):
         password_hash: Hash da senha do usuário.
         created_at: Data e hora de criação do usuário.
         updated_at: Data e hora da última atualização do usuário.
-        last_login: Data e hora do último login.
+        last_login_ts: Último login em segundos desde a época Unix (0 = nunca).
     """
-    id: PyObjectId = Field(default_factory=PyObjectId, alias="_id")
+    id: PyObjectId = Field(default_factory=ObjectId, alias="_id")
     password_hash: str
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
-    last_login: Optional[datetime] = None
+    last_login_ts: int = 0
     
-    class Config:
-        populate_by_name = True
-        arbitrary_types_allowed = True
-        json_encoders = {ObjectId: str}
-        json_schema_extra = {
+    model_config = ConfigDict(
+        populate_by_name=True,
+        json_schema_extra={
             "example": {
                 "_id": "60d6e04aec32c02a5a7c7d40",
                 "name": "João Silva",
@@ -138,9 +174,22 @@ class UserInDB(UserBase):
                 "is_active": True,
                 "created_at": "2023-05-15T10:00:00",
                 "updated_at": "2023-05-15T10:00:00",
-                "last_login": "2023-05-15T15:30:00"
+                "last_login_ts": 1684164600
             }
         }
+    )
+    
+    @property
+    def last_login(self) -> Optional[datetime]:
+        """
+        Data e hora do último login, derivada de ``last_login_ts`` sob demanda.
+        
+        Returns:
+            Data e hora do último login (em UTC) ou None se o usuário nunca fez login.
+        """
+        if not self.last_login_ts:
+            return None
+        return datetime.fromtimestamp(self.last_login_ts, timezone.utc)
     
     def has_permission(self, permission: Permission) -> bool:
         """
@@ -152,10 +201,7 @@ class UserInDB(UserBase):
         Returns:
             True se o usuário tem a permissão, False caso contrário.
         """
-        if not self.is_active:
-            return False
-        
-        return permission in ROLE_PERMISSIONS.get(self.role, [])
+        return _role_has(self.role, permission, self.is_active)
     
     def is_admin(self) -> bool:
         """
@@ -175,7 +221,7 @@ class UserInDB(UserBase):
         """
         return self.role == UserRole.USER
     
-    def can_access_resource(self, resource_owner_id: ObjectId) -> bool:
+    def can_access_resource(self, resource_owner_id: Union[ObjectId, str]) -> bool:
         """
         Verifica se o usuário pode acessar um recurso específico.
         
@@ -189,7 +235,10 @@ class UserInDB(UserBase):
         if self.is_admin():
             return True
         
-        # Usuários regulares só podem acessar seus próprios recursos
+        # Usuários regulares só podem acessar seus próprios recursos.
+        # Compara ObjectIds diretamente quando possível, evitando conversões para string.
+        if isinstance(resource_owner_id, ObjectId) and isinstance(self.id, ObjectId):
+            return self.id == resource_owner_id
         return str(self.id) == str(resource_owner_id)
 
 
@@ -205,18 +254,17 @@ class UserResponse(BaseModel):
         is_active: Indica se o usuário está ativo.
         created_at: Data e hora de criação do usuário.
     """
-    id: str = Field(..., alias="_id")
+    id: str
     name: str
-    email: EmailStr
+    email: str
     role: UserRole
     is_active: bool
     created_at: datetime
     
-    class Config:
-        populate_by_name = True
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
-                "_id": "60d6e04aec32c02a5a7c7d40",
+                "id": "60d6e04aec32c02a5a7c7d40",
                 "name": "João Silva",
                 "email": "joao.silva@exemplo.com",
                 "role": "user",
@@ -224,6 +272,7 @@ class UserResponse(BaseModel):
                 "created_at": "2023-05-15T10:00:00"
             }
         }
+    )
 
 
 class UserResponseAdmin(UserResponse):
@@ -237,10 +286,10 @@ class UserResponseAdmin(UserResponse):
     updated_at: datetime
     last_login: Optional[datetime]
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
-                "_id": "60d6e04aec32c02a5a7c7d40",
+                "id": "60d6e04aec32c02a5a7c7d40",
                 "name": "João Silva",
                 "email": "joao.silva@exemplo.com",
                 "role": "user",
@@ -250,10 +299,18 @@ class UserResponseAdmin(UserResponse):
                 "last_login": "2023-05-15T15:30:00"
             }
         }
+    )
 
 
 # Configuração para índices no MongoDB
 user_indexes = [
     IndexModel([("email", ASCENDING)], unique=True),
     IndexModel([("created_at", ASCENDING)])
+]
+
+# Índices para tokens de recuperação de senha
+password_reset_indexes = [
+    IndexModel([("token", ASCENDING), ("expires_at", ASCENDING)]),
+    # TTL: o MongoDB remove o documento assim que expires_at passa
+    IndexModel([("expires_at", ASCENDING)], expireAfterSeconds=0)
 ] 
\ No newline at end of file
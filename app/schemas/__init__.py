@@ -1,3 +1,23 @@
 """
 Módulo contendo os schemas da aplicação.
-""" 
\ No newline at end of file
+"""
+
+from typing import Any, Callable, Dict
+
+
+def lazy_example(factory: Callable[[], Dict[str, Any]]) -> Callable[[Dict[str, Any]], None]:
+    """
+    Adia a construção dos exemplos de um schema até a geração do OpenAPI.
+    
+    Os dicionários de exemplo só são montados quando o JSON schema é
+    solicitado, em vez de ficarem residentes desde a definição da classe.
+    
+    Args:
+        factory: Função que retorna os campos extras do schema (ex.: "example").
+        
+    Returns:
+        Callable compatível com ``json_schema_extra`` do Pydantic.
+    """
+    def apply(schema: Dict[str, Any]) -> None:
+        schema.update(factory())
+    return apply
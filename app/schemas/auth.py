@@ -7,7 +7,9 @@ autenticação, como login, registro, recuperação de senha, etc.
 
 from datetime import datetime
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, EmailStr, Field, validator
+from pydantic import BaseModel, EmailStr, Field, validator, ConfigDict, TypeAdapter
+
+from app.schemas import lazy_example
 
 
 class Token(BaseModel):
@@ -23,14 +25,15 @@ class Token(BaseModel):
     token_type: str
     expires_at: datetime
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra=lazy_example(lambda: {
             "example": {
                 "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
                 "token_type": "bearer",
                 "expires_at": "2023-05-15T11:00:00"
             }
-        }
+        })
+    )
 
 
 class LoginRequest(BaseModel):
@@ -44,13 +47,14 @@ class LoginRequest(BaseModel):
     email: EmailStr
     password: str = Field(..., min_length=8)
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra=lazy_example(lambda: {
             "example": {
                 "email": "usuario@exemplo.com",
                 "password": "senha_segura_123"
             }
-        }
+        })
+    )
 
 
 class RegisterRequest(BaseModel):
@@ -82,15 +86,16 @@ class RegisterRequest(BaseModel):
             raise ValueError("As senhas não coincidem")
         return v
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra=lazy_example(lambda: {
             "example": {
                 "name": "João Silva",
                 "email": "joao.silva@exemplo.com",
                 "password": "senha_segura_123",
                 "password_confirm": "senha_segura_123"
             }
-        }
+        })
+    )
 
 
 class PasswordResetRequest(BaseModel):
@@ -102,12 +107,13 @@ class PasswordResetRequest(BaseModel):
     """
     email: EmailStr
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra=lazy_example(lambda: {
             "example": {
                 "email": "usuario@exemplo.com"
             }
-        }
+        })
+    )
 
 
 class PasswordResetConfirmRequest(BaseModel):
@@ -130,14 +136,15 @@ class PasswordResetConfirmRequest(BaseModel):
             raise ValueError("As senhas não coincidem")
         return v
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra=lazy_example(lambda: {
             "example": {
                 "token": "abcdef123456789...",
                 "new_password": "nova_senha_segura_123",
                 "new_password_confirm": "nova_senha_segura_123"
             }
-        }
+        })
+    )
 
 
 class ChangePasswordRequest(BaseModel):
@@ -160,14 +167,15 @@ class ChangePasswordRequest(BaseModel):
             raise ValueError("As senhas não coincidem")
         return v
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra=lazy_example(lambda: {
             "example": {
                 "current_password": "senha_atual_123",
                 "new_password": "nova_senha_segura_123",
                 "new_password_confirm": "nova_senha_segura_123"
             }
-        }
+        })
+    )
 
 
 class UpdateRoleRequest(BaseModel):
@@ -179,12 +187,13 @@ class UpdateRoleRequest(BaseModel):
     """
     role: str = Field(..., pattern="^(user|admin)$")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra=lazy_example(lambda: {
             "example": {
                 "role": "admin"
             }
-        }
+        })
+    )
 
 
 class UserResponse(BaseModel):
@@ -199,25 +208,25 @@ class UserResponse(BaseModel):
         is_active: Indica se o usuário está ativo.
         created_at: Data e hora de criação do usuário.
     """
-    id: str = Field(..., alias="_id")
+    id: str
     name: str
-    email: EmailStr
+    email: str
     role: str
     is_active: bool
     created_at: datetime
     
-    class Config:
-        allow_population_by_field_name = True
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra=lazy_example(lambda: {
             "example": {
-                "_id": "60d6e04aec32c02a5a7c7d40",
+                "id": "60d6e04aec32c02a5a7c7d40",
                 "name": "João Silva",
                 "email": "joao.silva@exemplo.com",
                 "role": "user",
                 "is_active": True,
                 "created_at": "2023-05-15T10:00:00"
             }
-        }
+        })
+    )
 
 
 class UserDetailResponse(UserResponse):
@@ -233,10 +242,10 @@ class UserDetailResponse(UserResponse):
     last_login: Optional[datetime] = None
     permissions: List[str]
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra=lazy_example(lambda: {
             "example": {
-                "_id": "60d6e04aec32c02a5a7c7d40",
+                "id": "60d6e04aec32c02a5a7c7d40",
                 "name": "João Silva",
                 "email": "joao.silva@exemplo.com",
                 "role": "user",
@@ -251,7 +260,8 @@ class UserDetailResponse(UserResponse):
                     "export_data"
                 ]
             }
-        }
+        })
+    )
 
 
 class UserListResponse(BaseModel):
@@ -263,4 +273,8 @@ class UserListResponse(BaseModel):
         users: Lista de usuários.
     """
     total: int
-    users: List[UserResponse] 
\ No newline at end of file
+    users: List[UserResponse] 
+
+
+# Adaptador compartilhado para converter lotes de usuários em uma única chamada
+USER_LIST_ADAPTER = TypeAdapter(List[UserResponse])
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 from typing import Dict, List, Any, Optional
 from enum import Enum
 import pandas as pd
@@ -19,8 +19,7 @@ class FinancialDataResponse(BaseModel):
     data: Dict[str, Any]
     metadata: Dict[str, Any]
     
-    class Config:
-        arbitrary_types_allowed = True  # Para permitir pandas.DataFrame
+    model_config = ConfigDict(arbitrary_types_allowed=True)  # Para permitir pandas.DataFrame
         
     def dict(self, **kwargs):
         """Sobrescreve o método dict para lidar com pandas DataFrames."""
@@ -8,9 +8,12 @@ dos endpoints relacionados a cenários financeiros.
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 from enum import Enum
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, validator, ConfigDict, TypeAdapter
+from pydantic.dataclasses import dataclass
 from fastapi import UploadFile, File
 
+from app.schemas import lazy_example
+
 class ScenarioType(str, Enum):
     """Tipos de cenários financeiros disponíveis."""
     REALISTIC = "realista"
@@ -33,15 +36,16 @@ class ScenarioParameter(BaseModel):
     expense_growth: Optional[float] = Field(None, ge=-100, description="Percentual de crescimento para despesas")
     investment_growth: Optional[float] = Field(None, ge=-100, description="Percentual de crescimento para investimentos")
     
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra=lazy_example(lambda: {
             "example": {
                 "revenue_growth": 10.0,
                 "cost_reduction": 5.0,
                 "expense_growth": -3.0,
                 "investment_growth": 15.0
             }
-        }
+        })
+    )
 
 class ScenarioCreateRequest(BaseModel):
     """
@@ -60,8 +64,8 @@ class ScenarioCreateRequest(BaseModel):
     financial_data_id: str = Field(..., description="ID dos dados financeiros a serem utilizados")
     parameters: Optional[ScenarioParameter] = Field(None, description="Parâmetros para ajustar o cenário")
     
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra=lazy_example(lambda: {
             "example": {
                 "title": "Cenário Otimista 2023",
                 "description": "Projeção otimista para o ano fiscal de 2023",
@@ -74,12 +78,35 @@ class ScenarioCreateRequest(BaseModel):
                     "investment_growth": 20.0
                 }
             }
-        }
+        })
+    )
 
-class ScenarioMetrics(BaseModel):
+@dataclass(
+    frozen=True,
+    slots=True,
+    config=ConfigDict(
+        extra="forbid",
+        json_schema_extra=lazy_example(lambda: {
+            "example": {
+                "total_revenue": 1250000.0,
+                "total_costs": 450000.0,
+                "total_expenses": 350000.0,
+                "total_margin": 800000.0,
+                "total_cashflow": 450000.0,
+                "final_balance": 500000.0,
+                "margin_percentage": 64.0,
+                "roi": 28.5
+            }
+        })
+    )
+)
+class ScenarioMetrics:
     """
     Métricas calculadas para um cenário financeiro.
     
+    Dataclass imutável com __slots__: as instâncias não carregam __dict__,
+    o que reduz a memória em listagens com muitos cenários.
+    
     Attributes:
         total_revenue: Receita total projetada.
         total_costs: Custos totais projetados.
@@ -98,20 +125,6 @@ class ScenarioMetrics(BaseModel):
     final_balance: float = Field(..., description="Saldo final projetado")
     margin_percentage: float = Field(..., description="Percentual de margem sobre receita")
     roi: float = Field(..., description="Retorno sobre investimento estimado")
-    
-    class Config:
-        schema_extra = {
-            "example": {
-                "total_revenue": 1250000.0,
-                "total_costs": 450000.0,
-                "total_expenses": 350000.0,
-                "total_margin": 800000.0,
-                "total_cashflow": 450000.0,
-                "final_balance": 500000.0,
-                "margin_percentage": 64.0,
-                "roi": 28.5
-            }
-        }
 
 class ScenarioResponse(BaseModel):
     """
@@ -138,8 +151,8 @@ class ScenarioResponse(BaseModel):
     metrics: ScenarioMetrics = Field(..., description="Métricas calculadas para o cenário")
     parameters: Optional[Dict[str, Any]] = Field(None, description="Parâmetros utilizados para gerar o cenário")
     
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra=lazy_example(lambda: {
             "example": {
                 "id": "60d9b5e7d2a68c001f45e124",
                 "title": "Cenário Otimista 2023",
@@ -165,7 +178,8 @@ class ScenarioResponse(BaseModel):
                     "investment_growth": 20.0
                 }
             }
-        }
+        })
+    )
 
 class ScenarioListResponse(BaseModel):
     """
@@ -178,8 +192,8 @@ class ScenarioListResponse(BaseModel):
     total: int = Field(..., description="Número total de cenários")
     scenarios: List[ScenarioResponse] = Field(..., description="Lista de cenários")
     
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra=lazy_example(lambda: {
             "example": {
                 "total": 3,
                 "scenarios": [
@@ -204,7 +218,11 @@ class ScenarioListResponse(BaseModel):
                     }
                 ]
             }
-        }
+        })
+    )
+
+# Adaptador compartilhado para converter lotes de cenários em uma única chamada
+SCENARIO_LIST_ADAPTER = TypeAdapter(List[ScenarioResponse])
 
 class SpreadsheetUploadResponse(BaseModel):
     """
@@ -225,8 +243,8 @@ class SpreadsheetUploadResponse(BaseModel):
     status: str = Field(..., description="Status do processamento")
     message: str = Field(..., description="Mensagem informativa")
     
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra=lazy_example(lambda: {
             "example": {
                 "id": "60d9b5e7d2a68c001f45e125",
                 "filename": "dados_financeiros_2023.xlsx",
@@ -235,7 +253,8 @@ class SpreadsheetUploadResponse(BaseModel):
                 "status": "success",
                 "message": "Planilha enviada com sucesso. Pronta para processamento."
             }
-        }
+        })
+    )
 
 class SpreadsheetProcessResponse(BaseModel):
     """
@@ -258,8 +277,8 @@ class SpreadsheetProcessResponse(BaseModel):
     sheets_processed: int = Field(..., description="Número de planilhas processadas")
     processed_date: datetime = Field(..., description="Data de processamento")
     
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra=lazy_example(lambda: {
             "example": {
                 "id": "60d9b5e7d2a68c001f45e125",
                 "filename": "dados_financeiros_2023.xlsx",
@@ -269,4 +288,5 @@ class SpreadsheetProcessResponse(BaseModel):
                 "sheets_processed": 5,
                 "processed_date": "2023-03-15T14:35:00"
             }
-        } 
\ No newline at end of file
+        }) 
+    )
\ No newline at end of file
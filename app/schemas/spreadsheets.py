@@ -7,9 +7,39 @@ dos endpoints relacionados a planilhas financeiras.
 
 from typing import Dict, List, Any, Optional
 from datetime import datetime
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, TypeAdapter, ConfigDict
 from fastapi import UploadFile, File
 
+from app.schemas import lazy_example
+
+
+def _metadata_example() -> Dict[str, Any]:
+    """Exemplo de metadados compartilhado entre os schemas."""
+    return {
+        "sheet_names": ["Receitas", "Custos", "Despesas", "Investimentos", "Resumo"],
+        "total_sheets": 5,
+        "processing_date": "2023-03-15T14:35:00",
+        "categories_found": ["receitas", "custos_variaveis", "despesas_pessoal", "investimentos"],
+        "total_categories": 4
+    }
+
+
+def _upload_example(**overrides: Any) -> Dict[str, Any]:
+    """Exemplo de planilha enviada, com campos opcionalmente sobrescritos."""
+    example = {
+        "id": "60d9b5e7d2a68c001f45e125",
+        "filename": "dados_financeiros_2023.xlsx",
+        "upload_date": "2023-03-15T14:30:00",
+        "size": 102400,
+        "status": "success",
+        "message": "Planilha enviada com sucesso. Pronta para processamento.",
+        "user_id": "60d6e04aec32c02a5a7c7d40",
+        "description": "Dados financeiros do primeiro trimestre de 2023"
+    }
+    example.update(overrides)
+    return example
+
+
 class SpreadsheetUploadRequest(BaseModel):
     """
     Requisição para upload de planilha Excel.
@@ -17,14 +47,15 @@ class SpreadsheetUploadRequest(BaseModel):
     Attributes:
         description: Descrição opcional da planilha.
     """
-    description: Optional[str] = Field(None, max_length=500, description="Descrição da planilha")
+    description: Optional[str] = Field(None, max_length=500)
     
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra=lazy_example(lambda: {
             "example": {
                 "description": "Dados financeiros do primeiro trimestre de 2023"
             }
-        }
+        })
+    )
 
 class SpreadsheetMetadata(BaseModel):
     """
@@ -37,22 +68,15 @@ class SpreadsheetMetadata(BaseModel):
         categories_found: Categorias financeiras identificadas.
         total_categories: Número total de categorias identificadas.
     """
-    sheet_names: List[str] = Field(..., description="Lista de nomes das planilhas")
-    total_sheets: int = Field(..., description="Número total de planilhas")
-    processing_date: datetime = Field(..., description="Data de processamento")
-    categories_found: List[str] = Field(..., description="Categorias financeiras identificadas")
-    total_categories: int = Field(..., description="Número total de categorias identificadas")
+    sheet_names: List[str]
+    total_sheets: int
+    processing_date: datetime
+    categories_found: List[str]
+    total_categories: int
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "sheet_names": ["Receitas", "Custos", "Despesas", "Investimentos", "Resumo"],
-                "total_sheets": 5,
-                "processing_date": "2023-03-15T14:35:00",
-                "categories_found": ["receitas", "custos_variaveis", "despesas_pessoal", "investimentos"],
-                "total_categories": 4
-            }
-        }
+    model_config = ConfigDict(
+        json_schema_extra=lazy_example(lambda: {"example": _metadata_example()})
+    )
 
 class CategoryInfo(BaseModel):
     """
@@ -63,18 +87,19 @@ class CategoryInfo(BaseModel):
         name: Nome formatado da categoria.
         description: Descrição da categoria.
     """
-    id: str = Field(..., description="Identificador da categoria")
-    name: str = Field(..., description="Nome formatado da categoria")
-    description: Optional[str] = Field(None, description="Descrição da categoria")
+    id: str
+    name: str
+    description: Optional[str] = None
     
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra=lazy_example(lambda: {
             "example": {
                 "id": "receitas",
                 "name": "Receitas",
                 "description": "Receitas e faturamento da empresa"
             }
-        }
+        })
+    )
 
 class SpreadsheetUploadResponse(BaseModel):
     """
@@ -90,28 +115,18 @@ class SpreadsheetUploadResponse(BaseModel):
         user_id: ID do usuário que enviou a planilha.
         description: Descrição opcional fornecida pelo usuário.
     """
-    id: str = Field(..., description="ID único da planilha")
-    filename: str = Field(..., description="Nome do arquivo")
-    upload_date: datetime = Field(..., description="Data de upload")
+    id: str
+    filename: str
+    upload_date: datetime
     size: int = Field(..., description="Tamanho do arquivo em bytes")
-    status: str = Field(..., description="Status do processamento")
-    message: str = Field(..., description="Mensagem informativa")
-    user_id: str = Field(..., description="ID do usuário que enviou a planilha")
-    description: Optional[str] = Field(None, description="Descrição fornecida pelo usuário")
+    status: str
+    message: str
+    user_id: str
+    description: Optional[str] = None
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "id": "60d9b5e7d2a68c001f45e125",
-                "filename": "dados_financeiros_2023.xlsx",
-                "upload_date": "2023-03-15T14:30:00",
-                "size": 102400,
-                "status": "success",
-                "message": "Planilha enviada com sucesso. Pronta para processamento.",
-                "user_id": "60d6e04aec32c02a5a7c7d40",
-                "description": "Dados financeiros do primeiro trimestre de 2023"
-            }
-        }
+    model_config = ConfigDict(
+        json_schema_extra=lazy_example(lambda: {"example": _upload_example()})
+    )
 
 class SpreadsheetProcessResponse(BaseModel):
     """
@@ -126,16 +141,16 @@ class SpreadsheetProcessResponse(BaseModel):
         metadata: Metadados do processamento.
         user_id: ID do usuário que enviou a planilha.
     """
-    id: str = Field(..., description="ID único da planilha")
-    filename: str = Field(..., description="Nome do arquivo")
-    status: str = Field(..., description="Status do processamento")
-    message: str = Field(..., description="Mensagem informativa")
-    categories: List[CategoryInfo] = Field(..., description="Lista de informações sobre categorias")
-    metadata: SpreadsheetMetadata = Field(..., description="Metadados do processamento")
-    user_id: str = Field(..., description="ID do usuário que enviou a planilha")
+    id: str
+    filename: str
+    status: str
+    message: str
+    categories: List[CategoryInfo]
+    metadata: SpreadsheetMetadata
+    user_id: str
     
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra=lazy_example(lambda: {
             "example": {
                 "id": "60d9b5e7d2a68c001f45e125",
                 "filename": "dados_financeiros_2023.xlsx",
@@ -153,16 +168,11 @@ class SpreadsheetProcessResponse(BaseModel):
                         "description": "Custos que variam de acordo com a produção"
                     }
                 ],
-                "metadata": {
-                    "sheet_names": ["Receitas", "Custos", "Despesas", "Investimentos", "Resumo"],
-                    "total_sheets": 5,
-                    "processing_date": "2023-03-15T14:35:00",
-                    "categories_found": ["receitas", "custos_variaveis", "despesas_pessoal", "investimentos"],
-                    "total_categories": 4
-                },
+                "metadata": _metadata_example(),
                 "user_id": "60d6e04aec32c02a5a7c7d40"
             }
-        }
+        })
+    )
 
 class SpreadsheetListResponse(BaseModel):
     """
@@ -172,34 +182,35 @@ class SpreadsheetListResponse(BaseModel):
         total: Número total de planilhas.
         spreadsheets: Lista de planilhas.
     """
-    total: int = Field(..., description="Número total de planilhas")
-    spreadsheets: List[SpreadsheetUploadResponse] = Field(..., description="Lista de planilhas")
+    total: int
+    spreadsheets: List[SpreadsheetUploadResponse]
     
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra=lazy_example(lambda: {
             "example": {
                 "total": 2,
                 "spreadsheets": [
-                    {
-                        "id": "60d9b5e7d2a68c001f45e125",
-                        "filename": "dados_financeiros_2023_Q1.xlsx",
-                        "upload_date": "2023-03-15T14:30:00",
-                        "size": 102400,
-                        "status": "processed",
-                        "message": "Planilha processada com sucesso",
-                        "user_id": "60d6e04aec32c02a5a7c7d40",
-                        "description": "Dados financeiros do primeiro trimestre de 2023"
-                    },
-                    {
-                        "id": "60d9b5e7d2a68c001f45e126",
-                        "filename": "dados_financeiros_2023_Q2.xlsx",
-                        "upload_date": "2023-06-15T10:15:00",
-                        "size": 98304,
-                        "status": "uploaded",
-                        "message": "Planilha enviada. Pendente de processamento.",
-                        "user_id": "60d6e04aec32c02a5a7c7d40",
-                        "description": "Dados financeiros do segundo trimestre de 2023"
-                    }
+                    _upload_example(
+                        filename="dados_financeiros_2023_Q1.xlsx",
+                        status="processed",
+                        message="Planilha processada com sucesso"
+                    ),
+                    _upload_example(
+                        id="60d9b5e7d2a68c001f45e126",
+                        filename="dados_financeiros_2023_Q2.xlsx",
+                        upload_date="2023-06-15T10:15:00",
+                        size=98304,
+                        status="uploaded",
+                        message="Planilha enviada. Pendente de processamento.",
+                        description="Dados financeiros do segundo trimestre de 2023"
+                    )
                 ]
             }
-        }
\ No newline at end of file
+        })
+    )
+
+
+# Adaptadores compartilhados, criados uma única vez na importação do módulo
+SPREADSHEET_UPLOAD_ADAPTER = TypeAdapter(SpreadsheetUploadResponse)
+# Serializa a lista de planilhas em lote, sem o envelope SpreadsheetListResponse
+SPREADSHEET_LIST_ADAPTER = TypeAdapter(List[SpreadsheetUploadResponse])
@@ -5,29 +5,69 @@ Este módulo contém a lógica de negócio para autenticação e autorização,
 incluindo registro, login, gerenciamento de papéis e permissões.
 """
 
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List, Tuple
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, Any, List, Tuple, Union
 from bson import ObjectId
+import time
 import uuid
 import secrets
-import string
 
 from fastapi import HTTPException, status, Request, Depends
+from pymongo import ReturnDocument
 from pymongo.database import Database
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 from pymongo.results import InsertOneResult, UpdateResult
 from pydantic import EmailStr
 
 from app.db.mongodb import get_database
-from app.models.user import UserInDB, UserCreate, UserRole, Permission, ROLE_PERMISSIONS
+from app.models.user import UserInDB, UserCreate, UserRole, Permission, ROLE_PERMISSION_STRINGS
 from app.utils.security import (
-    get_password_hash, 
-    verify_password, 
+    aget_password_hash,
+    averify_password,
     create_user_token,
     login_rate_limiter
 )
 from app.core.config import settings
 
 
+# Campos carregados na listagem de usuários; o hash de senha nunca é necessário
+_USER_LIST_PROJECTION = {
+    "name": 1,
+    "email": 1,
+    "role": 1,
+    "is_active": 1,
+    "created_at": 1,
+    "updated_at": 1,
+    "last_login_ts": 1
+}
+
+
+# Cache em memória de resumos de autorização: user_id -> (expiração, resumo)
+_USER_AUTH_CACHE: Dict[str, Tuple[float, Tuple[UserRole, bool, Tuple[str, ...]]]] = {}
+_USER_AUTH_CACHE_TTL = 30
+_USER_AUTH_CACHE_MAXSIZE = 10_000
+
+
+def _user_from_document(user_data: Dict[str, Any]) -> UserInDB:
+    """
+    Constrói um UserInDB a partir de um documento confiável do banco.
+    
+    Os documentos foram validados na escrita, então usamos ``model_construct``
+    para evitar a revalidação completa. Como os validadores não são executados,
+    os campos que precisam de conversão são tratados explicitamente aqui.
+    
+    Args:
+        user_data: Documento do usuário retornado pelo MongoDB.
+        
+    Returns:
+        UserInDB: Usuário construído sem validação.
+    """
+    return UserInDB.model_construct(
+        **{**user_data, "role": UserRole(user_data.get("role", UserRole.USER))}
+    )
+
+
 async def get_user_by_email(db: Database, email: str) -> Optional[UserInDB]:
     """
     Busca um usuário pelo email.
@@ -41,32 +81,98 @@ async def get_user_by_email(db: Database, email: str) -> Optional[UserInDB]:
     """
     user_data = await db["users"].find_one({"email": email})
     if user_data:
-        return UserInDB(**user_data)
+        return _user_from_document(user_data)
     return None
 
 
-async def get_user_by_id(db: Database, user_id: str) -> Optional[UserInDB]:
+async def get_user_by_id(db: Database, user_id: Union[str, ObjectId]) -> Optional[UserInDB]:
     """
     Busca um usuário pelo ID.
     
     Args:
         db: Instância do banco de dados.
-        user_id: ID do usuário.
+        user_id: ID do usuário, como string ou ObjectId já convertido.
         
     Returns:
         Optional[UserInDB]: Usuário encontrado ou None.
     """
-    try:
-        object_id = ObjectId(user_id)
-        user_data = await db["users"].find_one({"_id": object_id})
-        if user_data:
-            return UserInDB(**user_data)
-    except:
-        pass
+    # Converte apenas quando necessário; IDs malformados não chegam ao banco
+    if isinstance(user_id, str):
+        if not ObjectId.is_valid(user_id):
+            return None
+        user_id = ObjectId(user_id)
+    
+    user_data = await db["users"].find_one({"_id": user_id})
+    if user_data:
+        return _user_from_document(user_data)
     return None
 
 
-async def authenticate_user(db: Database, email: str, password: str) -> Optional[UserInDB]:
+async def _get_user_auth_fields(db: Database, user_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Busca apenas os campos necessários para emitir um token.
+    
+    Args:
+        db: Instância do banco de dados.
+        user_id: ID do usuário.
+        
+    Returns:
+        Optional[Dict[str, Any]]: Documento com ``_id``, ``role`` e ``is_active``
+        ou None se o usuário não existir.
+    """
+    if not ObjectId.is_valid(user_id):
+        return None
+    return await db["users"].find_one(
+        {"_id": ObjectId(user_id)},
+        projection={"role": 1, "is_active": 1}
+    )
+
+
+async def get_user_auth_snapshot(
+    db: Database,
+    user_id: str
+) -> Optional[Tuple[UserRole, bool, Tuple[str, ...]]]:
+    """
+    Obtém um resumo de autorização do usuário, usando um cache com TTL.
+    
+    O resumo contém apenas papel, status e permissões; o hash de senha
+    nunca é armazenado no cache.
+    
+    Args:
+        db: Instância do banco de dados.
+        user_id: ID do usuário.
+        
+    Returns:
+        Optional[Tuple[UserRole, bool, Tuple[str, ...]]]: Tupla
+        ``(role, is_active, permissions)`` ou None se o usuário não existir.
+    """
+    now = time.monotonic()
+    cached = _USER_AUTH_CACHE.get(user_id)
+    if cached and cached[0] > now:
+        return cached[1]
+    
+    user_fields = await _get_user_auth_fields(db, user_id)
+    if not user_fields:
+        _USER_AUTH_CACHE.pop(user_id, None)
+        return None
+    
+    role = UserRole(user_fields.get("role", UserRole.USER))
+    snapshot = (role, user_fields.get("is_active", True), ROLE_PERMISSION_STRINGS.get(role, ()))
+    
+    # Descarta a entrada mais antiga quando o cache está cheio
+    if len(_USER_AUTH_CACHE) >= _USER_AUTH_CACHE_MAXSIZE and user_id not in _USER_AUTH_CACHE:
+        _USER_AUTH_CACHE.pop(next(iter(_USER_AUTH_CACHE)))
+    _USER_AUTH_CACHE[user_id] = (now + _USER_AUTH_CACHE_TTL, snapshot)
+    
+    return snapshot
+
+
+async def authenticate_user(
+    db: Database,
+    email: str,
+    password: str,
+    touch_last_login: bool = False
+) -> Optional[UserInDB]:
     """
     Autentica um usuário pelo email e senha.
     
@@ -74,18 +180,80 @@ async def authenticate_user(db: Database, email: str, password: str) -> Optional
         db: Instância do banco de dados.
         email: Email do usuário.
         password: Senha do usuário.
+        touch_last_login: Se True, atualiza o último login na mesma operação
+            que busca o usuário (o campo é gravado mesmo se a senha falhar).
         
     Returns:
         Optional[UserInDB]: Usuário autenticado ou None.
     """
-    user = await get_user_by_email(db, email)
+    if touch_last_login:
+        # Busca e atualiza em uma única ida ao banco, mantendo o documento
+        # anterior para verificar o hash da senha
+        user_data = await db["users"].find_one_and_update(
+            {"email": email},
+            {"$set": {"last_login_ts": int(time.time())}},
+            return_document=ReturnDocument.BEFORE
+        )
+        user = _user_from_document(user_data) if user_data else None
+    else:
+        user = await get_user_by_email(db, email)
     if not user:
         return None
-    if not verify_password(password, user.password_hash):
+    if not await averify_password(password, user.password_hash):
         return None
     return user
 
 
+def _new_user(user_data: UserCreate, password_hash: str, now: datetime) -> UserInDB:
+    """
+    Constrói o UserInDB de um novo usuário sem repetir a validação.
+    
+    ``user_data`` já foi validado na entrada da API, então seus campos são
+    reaproveitados diretamente com ``model_construct``.
+    
+    Args:
+        user_data: Dados validados do usuário.
+        password_hash: Hash da senha do usuário.
+        now: Data e hora usadas em ``created_at`` e ``updated_at``.
+        
+    Returns:
+        UserInDB: Usuário pronto para ser persistido.
+    """
+    fields = user_data.__dict__.copy()
+    fields.pop("password")
+    return UserInDB.model_construct(
+        **fields,
+        password_hash=password_hash,
+        created_at=now,
+        updated_at=now
+    )
+
+
+def _user_document(user_in_db: UserInDB) -> Dict[str, Any]:
+    """
+    Monta o documento de inserção a partir de um usuário já validado.
+    
+    Evita uma nova serialização completa do modelo via ``model_dump``.
+    
+    Args:
+        user_in_db: Usuário a ser persistido.
+        
+    Returns:
+        Dict[str, Any]: Documento pronto para o MongoDB.
+    """
+    return {
+        "_id": user_in_db.id,
+        "name": user_in_db.name,
+        "email": user_in_db.email,
+        "role": user_in_db.role.value,
+        "is_active": user_in_db.is_active,
+        "password_hash": user_in_db.password_hash,
+        "created_at": user_in_db.created_at,
+        "updated_at": user_in_db.updated_at,
+        "last_login_ts": user_in_db.last_login_ts
+    }
+
+
 async def create_user(db: Database, user_data: UserCreate) -> UserInDB:
     """
     Cria um novo usuário.
@@ -100,24 +268,30 @@ async def create_user(db: Database, user_data: UserCreate) -> UserInDB:
     Raises:
         HTTPException: Se o email já estiver em uso.
     """
-    # Verifica se o email já está em uso
-    existing_user = await get_user_by_email(db, user_data.email)
+    now = datetime.now(timezone.utc)
+    
+    # Calcula o hash em uma thread enquanto verifica se o email já existe
+    hash_task = asyncio.create_task(aget_password_hash(user_data.password))
+    existing_user = await db["users"].find_one({"email": user_data.email}, projection={"_id": 1})
     if existing_user:
+        hash_task.cancel()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email já está em uso"
         )
     
     # Criar novo usuário com hash da senha
-    user_in_db = UserInDB(
-        **user_data.model_dump(exclude={"password"}),
-        password_hash=get_password_hash(user_data.password),
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow()
-    )
+    user_in_db = _new_user(user_data, await hash_task, now)
     
-    # Inserir no banco de dados
-    result = await db["users"].insert_one(user_in_db.model_dump(by_alias=True))
+    # Inserir no banco de dados; o índice único em email rejeita duplicatas
+    # criadas entre a verificação acima e a inserção
+    try:
+        result = await db["users"].insert_one(_user_document(user_in_db))
+    except DuplicateKeyError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email já está em uso"
+        )
     
     # Atualiza o ID
     user_in_db.id = result.inserted_id
@@ -125,6 +299,48 @@ async def create_user(db: Database, user_data: UserCreate) -> UserInDB:
     return user_in_db
 
 
+async def create_users_bulk(db: Database, users_data: List[UserCreate]) -> List[UserInDB]:
+    """
+    Cria vários usuários de uma vez (ex.: carga inicial de administração).
+    
+    Os hashes de senha são calculados em paralelo em threads e os documentos
+    são enviados em um único ``insert_many`` não ordenado. Emails já
+    cadastrados são ignorados graças ao índice único.
+    
+    Args:
+        db: Instância do banco de dados.
+        users_data: Dados dos usuários a serem criados.
+        
+    Returns:
+        List[UserInDB]: Usuários efetivamente criados.
+    """
+    if not users_data:
+        return []
+    
+    # Calcula todos os hashes em paralelo, fora do event loop
+    password_hashes = await asyncio.gather(
+        *(aget_password_hash(user_data.password) for user_data in users_data)
+    )
+    
+    now = datetime.now(timezone.utc)
+    users = [
+        _new_user(user_data, password_hash, now)
+        for user_data, password_hash in zip(users_data, password_hashes)
+    ]
+    
+    # Insere todos os documentos; duplicatas falham individualmente
+    failed_indexes = set()
+    try:
+        await db["users"].insert_many(
+            [_user_document(user) for user in users],
+            ordered=False
+        )
+    except BulkWriteError as e:
+        failed_indexes = {error["index"] for error in e.details.get("writeErrors", [])}
+    
+    return [user for index, user in enumerate(users) if index not in failed_indexes]
+
+
 async def login(db: Database, email: str, password: str, client_ip: str) -> Dict[str, Any]:
     """
     Realiza o login de um usuário e gera um token JWT.
@@ -149,7 +365,7 @@ async def login(db: Database, email: str, password: str, client_ip: str) -> Dict
         )
     
     # Autentica o usuário
-    user = await authenticate_user(db, email, password)
+    user = await authenticate_user(db, email, password, touch_last_login=True)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -163,17 +379,11 @@ async def login(db: Database, email: str, password: str, client_ip: str) -> Dict
             detail="Usuário inativo"
         )
     
-    # Atualiza a última data de login
-    await db["users"].update_one(
-        {"_id": user.id},
-        {"$set": {"last_login": datetime.utcnow()}}
-    )
-    
     # Cria o token JWT
     token_data = create_user_token(
         user_id=str(user.id),
         role=user.role.value,
-        permissions=[p.value for p in ROLE_PERMISSIONS.get(user.role, [])]
+        permissions=ROLE_PERMISSION_STRINGS.get(user.role, ())
     )
     
     return token_data
@@ -193,14 +403,16 @@ async def refresh_token(db: Database, user_id: str) -> Dict[str, Any]:
     Raises:
         HTTPException: Se o usuário não for encontrado ou estiver inativo.
     """
-    user = await get_user_by_id(db, user_id)
-    if not user:
+    # Usa o resumo de autorização, evitando ir ao banco a cada renovação
+    snapshot = await get_user_auth_snapshot(db, user_id)
+    if not snapshot:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Usuário não encontrado"
         )
     
-    if not user.is_active:
+    role, is_active, permissions = snapshot
+    if not is_active:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Usuário inativo"
@@ -208,9 +420,9 @@ async def refresh_token(db: Database, user_id: str) -> Dict[str, Any]:
     
     # Cria o token JWT
     token_data = create_user_token(
-        user_id=str(user.id),
-        role=user.role.value,
-        permissions=[p.value for p in ROLE_PERMISSIONS.get(user.role, [])]
+        user_id=user_id,
+        role=role.value,
+        permissions=permissions
     )
     
     return token_data
@@ -220,7 +432,7 @@ async def update_user_role(
     db: Database, 
     user_id: str, 
     new_role: UserRole,
-    admin_user_id: str
+    admin_user: UserInDB
 ) -> UserInDB:
     """
     Atualiza o papel de um usuário.
@@ -229,7 +441,7 @@ async def update_user_role(
         db: Instância do banco de dados.
         user_id: ID do usuário a ser atualizado.
         new_role: Novo papel para o usuário.
-        admin_user_id: ID do administrador realizando a alteração.
+        admin_user: Administrador autenticado realizando a alteração.
         
     Returns:
         UserInDB: Usuário atualizado.
@@ -237,42 +449,39 @@ async def update_user_role(
     Raises:
         HTTPException: Se o usuário não for encontrado ou a operação falhar.
     """
-    # Verifica se o admin existe
-    admin = await get_user_by_id(db, admin_user_id)
-    if not admin or not admin.is_admin():
+    now = datetime.now(timezone.utc)
+    
+    # Verifica se quem solicita é administrador
+    if not admin_user or not admin_user.is_admin():
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Apenas administradores podem alterar papéis de usuários"
         )
     
-    # Verifica se o usuário existe
-    user = await get_user_by_id(db, user_id)
-    if not user:
+    # Atualiza o papel e obtém o documento resultante em uma única operação
+    updated_data = None
+    if ObjectId.is_valid(user_id):
+        updated_data = await db["users"].find_one_and_update(
+            {"_id": ObjectId(user_id)},
+            {
+                "$set": {
+                    "role": new_role.value,
+                    "updated_at": now
+                }
+            },
+            return_document=ReturnDocument.AFTER
+        )
+    
+    if not updated_data:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Usuário não encontrado"
         )
     
-    # Atualiza o papel do usuário
-    result = await db["users"].update_one(
-        {"_id": ObjectId(user_id)},
-        {
-            "$set": {
-                "role": new_role.value,
-                "updated_at": datetime.utcnow()
-            }
-        }
-    )
+    # Invalida o resumo de autorização em cache
+    _USER_AUTH_CACHE.pop(user_id, None)
     
-    if result.modified_count == 0:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Não foi possível atualizar o papel do usuário"
-        )
-    
-    # Retorna o usuário atualizado
-    updated_user = await get_user_by_id(db, user_id)
-    return updated_user
+    return _user_from_document(updated_data)
 
 
 async def start_password_reset(db: Database, email: str) -> Tuple[bool, str]:
@@ -286,16 +495,18 @@ async def start_password_reset(db: Database, email: str) -> Tuple[bool, str]:
     Returns:
         Tuple[bool, str]: Tupla com indicador de sucesso e token de reset.
     """
+    now = datetime.now(timezone.utc)
+    
     user = await get_user_by_email(db, email)
     if not user:
         # Não revelamos se o email existe ou não por segurança
         return False, ""
     
     # Gera um token aleatório
-    reset_token = ''.join(secrets.choice(string.ascii_letters + string.digits) for _ in range(32))
+    reset_token = secrets.token_urlsafe(24)
     
     # Define a expiração (24 horas)
-    expiration = datetime.utcnow() + timedelta(hours=24)
+    expiration = now + timedelta(hours=24)
     
     # Salva o token no banco
     await db["password_resets"].update_one(
@@ -304,7 +515,7 @@ async def start_password_reset(db: Database, email: str) -> Tuple[bool, str]:
             "$set": {
                 "token": reset_token,
                 "expires_at": expiration,
-                "created_at": datetime.utcnow()
+                "created_at": now
             }
         },
         upsert=True
@@ -326,9 +537,11 @@ async def validate_reset_token(db: Database, token: str) -> Optional[str]:
     Returns:
         Optional[str]: ID do usuário se o token for válido, None caso contrário.
     """
+    now = datetime.now(timezone.utc)
+    
     reset_data = await db["password_resets"].find_one({
         "token": token,
-        "expires_at": {"$gt": datetime.utcnow()}
+        "expires_at": {"$gt": now}
     })
     
     if not reset_data:
@@ -352,8 +565,14 @@ async def reset_password(db: Database, token: str, new_password: str) -> bool:
     Raises:
         HTTPException: Se o token for inválido ou expirado.
     """
-    user_id = await validate_reset_token(db, token)
-    if not user_id:
+    now = datetime.now(timezone.utc)
+    
+    # Consome o token de forma atômica: apenas uma requisição consegue usá-lo
+    reset_data = await db["password_resets"].find_one_and_delete({
+        "token": token,
+        "expires_at": {"$gt": now}
+    })
+    if not reset_data:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Token inválido ou expirado"
@@ -361,18 +580,15 @@ async def reset_password(db: Database, token: str, new_password: str) -> bool:
     
     # Atualiza a senha
     result = await db["users"].update_one(
-        {"_id": ObjectId(user_id)},
+        {"_id": reset_data["user_id"]},
         {
             "$set": {
-                "password_hash": get_password_hash(new_password),
-                "updated_at": datetime.utcnow()
+                "password_hash": await aget_password_hash(new_password),
+                "updated_at": now
             }
         }
     )
     
-    # Remove o token usado
-    await db["password_resets"].delete_one({"token": token})
-    
     return result.modified_count > 0
 
 
@@ -397,6 +613,8 @@ async def update_user_password(
     Raises:
         HTTPException: Se a senha atual for incorreta.
     """
+    now = datetime.now(timezone.utc)
+    
     user = await get_user_by_id(db, user_id)
     if not user:
         raise HTTPException(
@@ -405,7 +623,7 @@ async def update_user_password(
         )
     
     # Verifica a senha atual
-    if not verify_password(current_password, user.password_hash):
+    if not await averify_password(current_password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Senha atual incorreta"
@@ -416,8 +634,8 @@ async def update_user_password(
         {"_id": user.id},
         {
             "$set": {
-                "password_hash": get_password_hash(new_password),
-                "updated_at": datetime.utcnow()
+                "password_hash": await aget_password_hash(new_password),
+                "updated_at": now
             }
         }
     )
@@ -443,7 +661,7 @@ async def get_users_list(
         role_filter: Filtrar por papel específico.
         
     Returns:
-        List[UserInDB]: Lista de usuários.
+        List[UserInDB]: Lista de usuários (sem o hash de senha carregado).
     """
     query = {}
     
@@ -453,16 +671,17 @@ async def get_users_list(
     if role_filter:
         query["role"] = role_filter.value
     
-    users_data = await db["users"].find(query).skip(skip).limit(limit).to_list(length=limit)
+    cursor = db["users"].find(query, projection=_USER_LIST_PROJECTION).skip(skip).limit(limit)
     
-    return [UserInDB(**user_data) for user_data in users_data]
+    # Constrói os usuários à medida que os documentos chegam do cursor
+    return [_user_from_document(user_data) async for user_data in cursor]
 
 
 async def update_user_active_status(
     db: Database,
     user_id: str,
     is_active: bool,
-    admin_user_id: str
+    admin_user: UserInDB
 ) -> UserInDB:
     """
     Ativa ou desativa um usuário.
@@ -471,7 +690,7 @@ async def update_user_active_status(
         db: Instância do banco de dados.
         user_id: ID do usuário a ser atualizado.
         is_active: Novo status de ativação.
-        admin_user_id: ID do administrador realizando a alteração.
+        admin_user: Administrador autenticado realizando a alteração.
         
     Returns:
         UserInDB: Usuário atualizado.
@@ -479,46 +698,43 @@ async def update_user_active_status(
     Raises:
         HTTPException: Se o usuário não for encontrado ou a operação falhar.
     """
-    # Verifica se o admin existe
-    admin = await get_user_by_id(db, admin_user_id)
-    if not admin or not admin.is_admin():
+    now = datetime.now(timezone.utc)
+    
+    # Verifica se quem solicita é administrador
+    if not admin_user or not admin_user.is_admin():
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Apenas administradores podem alterar status de usuários"
         )
     
-    # Verifica se o usuário existe
-    user = await get_user_by_id(db, user_id)
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Usuário não encontrado"
-        )
-    
     # Impede que um admin desative a si mesmo
-    if str(user.id) == admin_user_id and not is_active:
+    if user_id == str(admin_user.id) and not is_active:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Não é possível desativar sua própria conta"
         )
     
-    # Atualiza o status do usuário
-    result = await db["users"].update_one(
-        {"_id": ObjectId(user_id)},
-        {
-            "$set": {
-                "is_active": is_active,
-                "updated_at": datetime.utcnow()
-            }
-        }
-    )
+    # Atualiza o status e obtém o documento resultante em uma única operação
+    updated_data = None
+    if ObjectId.is_valid(user_id):
+        updated_data = await db["users"].find_one_and_update(
+            {"_id": ObjectId(user_id)},
+            {
+                "$set": {
+                    "is_active": is_active,
+                    "updated_at": now
+                }
+            },
+            return_document=ReturnDocument.AFTER
+        )
     
-    if result.modified_count == 0:
+    if not updated_data:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Não foi possível atualizar o status do usuário"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Usuário não encontrado"
         )
     
-    # Retorna o usuário atualizado
-    updated_user = await get_user_by_id(db, user_id)
-    return updated_user 
\ No newline at end of file
+    # Invalida o resumo de autorização em cache
+    _USER_AUTH_CACHE.pop(user_id, None)
+    
+    return _user_from_document(updated_data)
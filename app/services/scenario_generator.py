@@ -8,16 +8,45 @@ pessimistas, otimistas e agressivas.
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any, Optional, Union
+import hashlib
+import json
+from typing import Dict, List, Any, Optional, Tuple, Union
 from datetime import datetime
 import logging
-from copy import deepcopy
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from app.services.excel_processor import ExcelProcessor, FinancialCategory
 
 # Configurar logger
 logger = logging.getLogger(__name__)
 
+# Cache em memória dos cenários gerados, por conteúdo dos dados, tipo e
+# parâmetros; guarda cópias, nunca os objetos entregues aos chamadores
+_SCENARIO_CACHE: Dict[str, Tuple[Dict[str, pd.DataFrame], Dict[str, Any]]] = {}
+_SCENARIO_CACHE_MAXSIZE = 64
+
+
+@lru_cache(maxsize=64)
+def _growth_factors(n_cols: int, initial_growth: float, growth_rate: float) -> np.ndarray:
+    """
+    Calcula os fatores de crescimento por período do cenário agressivo.
+    
+    Os parâmetros costumam se repetir entre requisições (em geral, os valores
+    padrão), então o vetor é memorizado e devolvido somente leitura.
+    
+    Args:
+        n_cols: Número de períodos (colunas numéricas).
+        initial_growth: Crescimento do primeiro período.
+        growth_rate: Incremento do crescimento a cada período.
+        
+    Returns:
+        Vetor float64 com o fator de cada período.
+    """
+    factors = 1 + initial_growth + np.arange(n_cols) * growth_rate
+    factors.setflags(write=False)
+    return factors
+
 
 class ScenarioType:
     """Tipos de cenários disponíveis."""
@@ -25,6 +54,9 @@ class ScenarioType:
     PESSIMISTIC = "pessimista"
     OPTIMISTIC = "otimista"
     AGGRESSIVE = "agressivo"
+    
+    # Todos os tipos, na ordem de apresentação
+    ALL = (REALISTIC, PESSIMISTIC, OPTIMISTIC, AGGRESSIVE)
 
 
 class ScenarioGenerator:
@@ -71,6 +103,11 @@ class ScenarioGenerator:
         """Inicializa o gerador de cenários."""
         self.financial_data = {}
         self.scenarios = {}
+        self._numeric_cols: Dict[str, List[str]] = {}
+        self._common_numeric_cols: List[str] = []
+        self._soa: Dict[str, Dict[str, np.ndarray]] = {}
+        self._original_sums: Dict[str, np.ndarray] = {}
+        self._template_non_numeric: Optional[pd.DataFrame] = None
         self.metadata = {
             "generation_date": datetime.now(),
             "scenarios_generated": []
@@ -102,18 +139,168 @@ class ScenarioGenerator:
         # Normaliza e converte dados para DataFrames se necessário
         self._normalize_financial_data()
         
+        # Reaproveita um cenário idêntico já gerado, se houver
+        cache_key = self._scenario_cache_key(scenario_type, parameters)
+        cached = self._get_cached_scenario(cache_key)
+        
+        if cached:
+            scenario_data, metrics = cached
+        else:
+            scenario_data, metrics = self._run_scenario(scenario_type, parameters)
+            self._store_cached_scenario(cache_key, scenario_data, metrics)
+        
+        return self._record_scenario(scenario_type, scenario_data, metrics)
+    
+    def generate_all_scenarios(
+        self,
+        financial_data: Dict[str, Any],
+        param_overrides: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Gera os quatro tipos de cenário a partir dos mesmos dados financeiros.
+        
+        Os dados são normalizados uma única vez e os cenários, independentes
+        entre si, são gerados em paralelo; o cache e o registro dos cenários
+        são atualizados apenas na thread chamadora.
+        
+        Args:
+            financial_data: Dados financeiros a serem analisados.
+            param_overrides: Parâmetros de cada tipo de cenário, por tipo.
+            
+        Returns:
+            Resposta de cada cenário, por tipo, no formato de generate_scenario.
+        """
+        # Inicializa e normaliza os dados financeiros
+        self.financial_data = financial_data
+        self._normalize_financial_data()
+        
+        param_overrides = param_overrides or {}
+        results = {}
+        pending = {}
+        
+        for scenario_type in ScenarioType.ALL:
+            parameters = param_overrides.get(scenario_type)
+            cache_key = self._scenario_cache_key(scenario_type, parameters)
+            cached = self._get_cached_scenario(cache_key)
+            if cached:
+                results[scenario_type] = cached
+            else:
+                pending[scenario_type] = (cache_key, parameters)
+        
+        if pending:
+            with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+                futures = {
+                    executor.submit(self._run_scenario, scenario_type, parameters): scenario_type
+                    for scenario_type, (_, parameters) in pending.items()
+                }
+                for future in as_completed(futures):
+                    scenario_type = futures[future]
+                    scenario_data, metrics = future.result()
+                    self._store_cached_scenario(pending[scenario_type][0], scenario_data, metrics)
+                    results[scenario_type] = (scenario_data, metrics)
+        
+        return {
+            scenario_type: self._record_scenario(scenario_type, *results[scenario_type])
+            for scenario_type in ScenarioType.ALL
+        }
+    
+    def _run_scenario(
+        self, 
+        scenario_type: str,
+        parameters: Optional[Dict[str, Any]]
+    ) -> Tuple[Dict[str, pd.DataFrame], Dict[str, Any]]:
+        """
+        Gera um cenário sobre os dados já normalizados.
+        
+        Apenas lê o estado da instância, podendo ser executado em paralelo
+        para tipos de cenário diferentes.
+        
+        Args:
+            scenario_type: Tipo de cenário.
+            parameters: Parâmetros do cenário.
+            
+        Returns:
+            Tupla (DataFrames do cenário, métricas).
+            
+        Raises:
+            ValueError: Se o tipo de cenário não for reconhecido.
+        """
         # Gera o cenário conforme o tipo
         if scenario_type == ScenarioType.REALISTIC:
-            scenario_data = self._generate_realistic_scenario(parameters)
+            scenario_arrays = self._generate_realistic_scenario(parameters)
         elif scenario_type == ScenarioType.PESSIMISTIC:
-            scenario_data = self._generate_pessimistic_scenario(parameters)
+            scenario_arrays = self._generate_pessimistic_scenario(parameters)
         elif scenario_type == ScenarioType.OPTIMISTIC:
-            scenario_data = self._generate_optimistic_scenario(parameters)
+            scenario_arrays = self._generate_optimistic_scenario(parameters)
         elif scenario_type == ScenarioType.AGGRESSIVE:
-            scenario_data = self._generate_aggressive_scenario(parameters)
+            scenario_arrays = self._generate_aggressive_scenario(parameters)
         else:
             raise ValueError(f"Tipo de cenário desconhecido: {scenario_type}")
         
+        # Calcula métricas relevantes para o cenário
+        metrics = self._calculate_scenario_metrics(scenario_arrays)
+        
+        # Monta os DataFrames apenas na saída
+        return self._build_dataframes(scenario_arrays), metrics
+    
+    @staticmethod
+    def _get_cached_scenario(
+        cache_key: Optional[str]
+    ) -> Optional[Tuple[Dict[str, pd.DataFrame], Dict[str, Any]]]:
+        """
+        Retorna uma cópia de um cenário em cache, se houver.
+        
+        Args:
+            cache_key: Chave do cenário, ou None se não puder ser cacheado.
+            
+        Returns:
+            Tupla (DataFrames do cenário, métricas) ou None.
+        """
+        cached = _SCENARIO_CACHE.get(cache_key) if cache_key else None
+        if not cached:
+            return None
+        return {category: df.copy() for category, df in cached[0].items()}, dict(cached[1])
+    
+    @staticmethod
+    def _store_cached_scenario(
+        cache_key: Optional[str],
+        scenario_data: Dict[str, pd.DataFrame],
+        metrics: Dict[str, Any]
+    ) -> None:
+        """
+        Guarda uma cópia de um cenário gerado no cache.
+        
+        Args:
+            cache_key: Chave do cenário, ou None se não puder ser cacheado.
+            scenario_data: DataFrames do cenário.
+            metrics: Métricas do cenário.
+        """
+        if not cache_key:
+            return
+        if len(_SCENARIO_CACHE) >= _SCENARIO_CACHE_MAXSIZE:
+            _SCENARIO_CACHE.pop(next(iter(_SCENARIO_CACHE)))
+        _SCENARIO_CACHE[cache_key] = (
+            {category: df.copy() for category, df in scenario_data.items()},
+            dict(metrics)
+        )
+    
+    def _record_scenario(
+        self, 
+        scenario_type: str,
+        scenario_data: Dict[str, pd.DataFrame],
+        metrics: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Registra um cenário gerado na instância e monta a resposta.
+        
+        Args:
+            scenario_type: Tipo de cenário.
+            scenario_data: DataFrames do cenário.
+            metrics: Métricas do cenário.
+            
+        Returns:
+            Dicionário contendo o cenário gerado.
+        """
         # Armazena o cenário gerado
         self.scenarios[scenario_type] = scenario_data
         
@@ -121,9 +308,6 @@ class ScenarioGenerator:
         if scenario_type not in self.metadata["scenarios_generated"]:
             self.metadata["scenarios_generated"].append(scenario_type)
         
-        # Calcula métricas relevantes para o cenário
-        metrics = self._calculate_scenario_metrics(scenario_data)
-        
         # Monta a resposta
         response = {
             "status": "success",
@@ -155,12 +339,138 @@ class ScenarioGenerator:
                 logger.warning(f"Tipo de dados desconhecido para categoria {category}: {type(data)}")
                 continue
         
+        # Colunas numéricas de cada categoria, calculadas uma única vez; os
+        # ajustes dos cenários não criam nem removem colunas
+        self._numeric_cols = {
+            category: df.columns[self._numeric_mask(df)].tolist()
+            for category, df in normalized_data.items()
+        }
+        
+        # Valores financeiros em float64: as métricas e os valores derivados
+        # são persistidos e não podem perder centavos. astype gera um novo
+        # DataFrame, sem alterar os dados recebidos
+        for category, numeric_cols in self._numeric_cols.items():
+            df = normalized_data[category]
+            if numeric_cols and not df[numeric_cols].dtypes.eq(np.float64).all():
+                normalized_data[category] = df.astype(dict.fromkeys(numeric_cols, np.float64))
+        
+        # Colunas em comum usadas pelos valores derivados, também invariantes
+        # entre os cenários
+        self._common_numeric_cols = self._find_common_numeric_columns(normalized_data)
+        
+        # Os cálculos dos cenários trabalham sobre um array por coluna numérica
+        # (estrutura de arrays); os DataFrames só são montados na resposta
+        self._soa = {
+            category: {col: normalized_data[category][col].to_numpy() for col in numeric_cols}
+            for category, numeric_cols in self._numeric_cols.items()
+        }
+        
+        # Somas por coluna dos dados originais, reutilizadas pelas categorias
+        # sem ajustes. São calculadas aqui, antes de qualquer cenário, para que
+        # a geração em paralelo apenas leia o estado da instância
+        self._original_sums = {
+            category: self._nansum_columns(columns)
+            for category, columns in self._soa.items()
+            if columns
+        }
+        
+        # Modelo dos DataFrames calculados: índice e colunas não numéricas do
+        # primeiro DataFrame com dados, que os ajustes não alteram
+        self._template_non_numeric = None
+        for df in normalized_data.values():
+            if not df.empty:
+                numeric_mask = df.dtypes.map(pd.api.types.is_numeric_dtype).to_numpy(dtype=bool)
+                self._template_non_numeric = df.loc[:, ~numeric_mask]
+                break
+        
         self.financial_data = normalized_data
     
+    def _scenario_cache_key(
+        self, 
+        scenario_type: str,
+        parameters: Optional[Dict[str, Any]]
+    ) -> Optional[str]:
+        """
+        Calcula a chave de cache de um cenário a partir do conteúdo dos dados.
+        
+        Args:
+            scenario_type: Tipo de cenário.
+            parameters: Parâmetros do cenário.
+            
+        Returns:
+            Hash hexadecimal ou None se os dados não puderem ser hasheados.
+        """
+        hasher = hashlib.blake2b(digest_size=20)
+        hasher.update(scenario_type.encode())
+        hasher.update(json.dumps(parameters or {}, sort_keys=True, default=str).encode())
+        
+        try:
+            for category in sorted(self.financial_data):
+                df = self.financial_data[category]
+                header = [category, [str(col) for col in df.columns], [str(dtype) for dtype in df.dtypes]]
+                hasher.update(json.dumps(header).encode())
+                hasher.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+        except TypeError:
+            # Células com objetos não hasheáveis (listas, dicionários)
+            return None
+        
+        return hasher.hexdigest()
+    
+    def _numeric_columns(self, category: str, df: pd.DataFrame) -> List[str]:
+        """
+        Retorna as colunas numéricas de uma categoria.
+        
+        Args:
+            category: Nome da categoria.
+            df: DataFrame da categoria, usado quando a categoria não está em cache.
+            
+        Returns:
+            Lista de nomes de colunas numéricas, na ordem do DataFrame.
+        """
+        numeric_cols = self._numeric_cols.get(category)
+        if numeric_cols is None:
+            numeric_cols = df.columns[self._numeric_mask(df)].tolist()
+        return numeric_cols
+    
+    @staticmethod
+    def _numeric_mask(df: pd.DataFrame) -> np.ndarray:
+        """
+        Indica quais colunas de um DataFrame são numéricas.
+        
+        Percorre os dtypes uma única vez, sem o custo de select_dtypes, que
+        monta um novo DataFrame. Colunas booleanas não são consideradas numéricas.
+        
+        Args:
+            df: DataFrame a inspecionar.
+            
+        Returns:
+            Máscara booleana com uma posição por coluna.
+        """
+        return np.fromiter(
+            (
+                pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+                for dtype in df.dtypes
+            ),
+            dtype=bool,
+            count=df.shape[1]
+        )
+    
+    def _clone_arrays(self) -> Dict[str, Dict[str, np.ndarray]]:
+        """
+        Copia a estrutura de colunas dos dados financeiros para um novo cenário.
+        
+        Os arrays são compartilhados: os ajustes nunca alteram um array no
+        lugar, apenas substituem a entrada da coluna por um novo array.
+        
+        Returns:
+            Colunas numéricas de cada categoria, em dicionários independentes.
+        """
+        return {category: dict(columns) for category, columns in self._soa.items()}
+    
     def _generate_realistic_scenario(
         self, 
         parameters: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, pd.DataFrame]:
+    ) -> Dict[str, Dict[str, np.ndarray]]:
         """
         Gera um cenário realista baseado nos dados atuais.
         
@@ -168,10 +478,10 @@ class ScenarioGenerator:
             parameters: Parâmetros adicionais (não utilizados neste cenário).
             
         Returns:
-            Dicionário com dados do cenário realista.
+            Colunas numéricas de cada categoria do cenário realista.
         """
         # Copia os dados originais
-        scenario_data = deepcopy(self.financial_data)
+        scenario_data = self._clone_arrays()
         
         # Recalcula valores derivados
         scenario_data = self._recalculate_derived_values(scenario_data)
@@ -181,7 +491,7 @@ class ScenarioGenerator:
     def _generate_pessimistic_scenario(
         self, 
         parameters: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, pd.DataFrame]:
+    ) -> Dict[str, Dict[str, np.ndarray]]:
         """
         Gera um cenário pessimista com redução de receitas e aumento de despesas.
         
@@ -189,7 +499,7 @@ class ScenarioGenerator:
             parameters: Parâmetros adicionais para ajuste do cenário.
             
         Returns:
-            Dicionário com dados do cenário pessimista.
+            Colunas numéricas de cada categoria do cenário pessimista.
         """
         # Pega parâmetros ou usa valores padrão
         revenue_adjustment = parameters.get("revenue_adjustment", -0.15) if parameters else -0.15
@@ -197,31 +507,14 @@ class ScenarioGenerator:
         expense_adjustment = parameters.get("expense_adjustment", 0.10) if parameters else 0.10
         
         # Copia os dados originais
-        scenario_data = deepcopy(self.financial_data)
+        scenario_data = self._clone_arrays()
         
-        # Ajusta receitas (redução)
-        for category in self.REVENUE_CATEGORIES:
-            category_key = category.value
-            if category_key in scenario_data:
-                df = scenario_data[category_key]
-                numeric_cols = df.select_dtypes(include=['number']).columns
-                df[numeric_cols] = df[numeric_cols] * (1 + revenue_adjustment)
-        
-        # Ajusta custos variáveis (aumento)
-        for category in self.VARIABLE_COST_CATEGORIES:
-            category_key = category.value
-            if category_key in scenario_data:
-                df = scenario_data[category_key]
-                numeric_cols = df.select_dtypes(include=['number']).columns
-                df[numeric_cols] = df[numeric_cols] * (1 + cost_adjustment)
-        
-        # Ajusta despesas fixas (aumento)
-        for category in self.FIXED_EXPENSE_CATEGORIES:
-            category_key = category.value
-            if category_key in scenario_data:
-                df = scenario_data[category_key]
-                numeric_cols = df.select_dtypes(include=['number']).columns
-                df[numeric_cols] = df[numeric_cols] * (1 + expense_adjustment)
+        # Ajusta receitas (redução), custos variáveis (aumento) e despesas fixas (aumento)
+        self._apply_adjustments(scenario_data, [
+            (self.REVENUE_CATEGORIES, revenue_adjustment),
+            (self.VARIABLE_COST_CATEGORIES, cost_adjustment),
+            (self.FIXED_EXPENSE_CATEGORIES, expense_adjustment)
+        ])
         
         # Recalcula valores derivados
         scenario_data = self._recalculate_derived_values(scenario_data)
@@ -231,7 +524,7 @@ class ScenarioGenerator:
     def _generate_optimistic_scenario(
         self, 
         parameters: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, pd.DataFrame]:
+    ) -> Dict[str, Dict[str, np.ndarray]]:
         """
         Gera um cenário otimista com aumento de receitas e redução de despesas.
         
@@ -239,7 +532,7 @@ class ScenarioGenerator:
             parameters: Parâmetros adicionais para ajuste do cenário.
             
         Returns:
-            Dicionário com dados do cenário otimista.
+            Colunas numéricas de cada categoria do cenário otimista.
         """
         # Pega parâmetros ou usa valores padrão
         revenue_adjustment = parameters.get("revenue_adjustment", 0.20) if parameters else 0.20
@@ -247,31 +540,14 @@ class ScenarioGenerator:
         expense_adjustment = parameters.get("expense_adjustment", -0.05) if parameters else -0.05
         
         # Copia os dados originais
-        scenario_data = deepcopy(self.financial_data)
+        scenario_data = self._clone_arrays()
         
-        # Ajusta receitas (aumento)
-        for category in self.REVENUE_CATEGORIES:
-            category_key = category.value
-            if category_key in scenario_data:
-                df = scenario_data[category_key]
-                numeric_cols = df.select_dtypes(include=['number']).columns
-                df[numeric_cols] = df[numeric_cols] * (1 + revenue_adjustment)
-        
-        # Ajusta custos variáveis (redução)
-        for category in self.VARIABLE_COST_CATEGORIES:
-            category_key = category.value
-            if category_key in scenario_data:
-                df = scenario_data[category_key]
-                numeric_cols = df.select_dtypes(include=['number']).columns
-                df[numeric_cols] = df[numeric_cols] * (1 + cost_adjustment)
-        
-        # Ajusta despesas fixas (redução)
-        for category in self.FIXED_EXPENSE_CATEGORIES:
-            category_key = category.value
-            if category_key in scenario_data:
-                df = scenario_data[category_key]
-                numeric_cols = df.select_dtypes(include=['number']).columns
-                df[numeric_cols] = df[numeric_cols] * (1 + expense_adjustment)
+        # Ajusta receitas (aumento), custos variáveis (redução) e despesas fixas (redução)
+        self._apply_adjustments(scenario_data, [
+            (self.REVENUE_CATEGORIES, revenue_adjustment),
+            (self.VARIABLE_COST_CATEGORIES, cost_adjustment),
+            (self.FIXED_EXPENSE_CATEGORIES, expense_adjustment)
+        ])
         
         # Recalcula valores derivados
         scenario_data = self._recalculate_derived_values(scenario_data)
@@ -281,7 +557,7 @@ class ScenarioGenerator:
     def _generate_aggressive_scenario(
         self, 
         parameters: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, pd.DataFrame]:
+    ) -> Dict[str, Dict[str, np.ndarray]]:
         """
         Gera um cenário agressivo com crescimento exponencial de receitas.
         
@@ -289,7 +565,7 @@ class ScenarioGenerator:
             parameters: Parâmetros adicionais para ajuste do cenário.
             
         Returns:
-            Dicionário com dados do cenário agressivo.
+            Colunas numéricas de cada categoria do cenário agressivo.
         """
         # Pega parâmetros ou usa valores padrão
         initial_growth = parameters.get("initial_growth", 0.30) if parameters else 0.30
@@ -297,140 +573,206 @@ class ScenarioGenerator:
         investment_adjustment = parameters.get("investment_adjustment", 0.25) if parameters else 0.25
         
         # Copia os dados originais
-        scenario_data = deepcopy(self.financial_data)
+        scenario_data = self._clone_arrays()
         
         # Ajusta receitas (crescimento exponencial)
         for category in self.REVENUE_CATEGORIES:
-            category_key = category.value
-            if category_key in scenario_data:
-                df = scenario_data[category_key]
-                numeric_cols = df.select_dtypes(include=['number']).columns
-                
+            columns = scenario_data.get(category.value)
+            if columns is not None:
                 # Aplica crescimento diferente para cada período
-                for i, col in enumerate(numeric_cols):
-                    growth_factor = 1 + initial_growth + (i * growth_rate)
-                    df[col] = df[col] * growth_factor
+                growth_factors = _growth_factors(len(columns), initial_growth, growth_rate)
+                self._apply_column_factors(columns, columns, growth_factors)
         
         # Aumenta investimentos
-        for category in self.INVESTMENT_CATEGORIES:
-            category_key = category.value
-            if category_key in scenario_data:
-                df = scenario_data[category_key]
-                numeric_cols = df.select_dtypes(include=['number']).columns
-                df[numeric_cols] = df[numeric_cols] * (1 + investment_adjustment)
+        self._apply_adjustments(scenario_data, [(self.INVESTMENT_CATEGORIES, investment_adjustment)])
         
         # Ajusta custos variáveis (proporcional às receitas, mas com eficiência)
-        original_revenue = self._sum_category_values(self.financial_data, self.REVENUE_CATEGORIES)
+        original_revenue = self._sum_category_values(self._soa, self.REVENUE_CATEGORIES)
         new_revenue = self._sum_category_values(scenario_data, self.REVENUE_CATEGORIES)
         
         if original_revenue.size > 0 and new_revenue.size > 0:
             revenue_growth = new_revenue / original_revenue
             revenue_growth[~np.isfinite(revenue_growth)] = 1.0  # Lidar com divisão por zero
             
-            # Custos crescem 80% do que as receitas crescem
-            for category in self.VARIABLE_COST_CATEGORIES:
-                category_key = category.value
-                if category_key in scenario_data and category_key in self.financial_data:
-                    df = scenario_data[category_key]
-                    df_orig = self.financial_data[category_key]
-                    numeric_cols = df.select_dtypes(include=['number']).columns
-                    
-                    for i, col in enumerate(numeric_cols):
-                        if i < len(revenue_growth):
-                            # Eficiência: apenas 80% do crescimento das receitas
-                            cost_growth = 1 + ((revenue_growth[i] - 1) * 0.8)
-                            df[col] = df_orig[col] * cost_growth
-            
-            # Despesas fixas crescem 50% do que as receitas crescem
-            for category in self.FIXED_EXPENSE_CATEGORIES:
-                category_key = category.value
-                if category_key in scenario_data and category_key in self.financial_data:
-                    df = scenario_data[category_key]
-                    df_orig = self.financial_data[category_key]
-                    numeric_cols = df.select_dtypes(include=['number']).columns
-                    
-                    for i, col in enumerate(numeric_cols):
-                        if i < len(revenue_growth):
-                            # Apenas 50% do crescimento das receitas
-                            expense_growth = 1 + ((revenue_growth[i] - 1) * 0.5)
-                            df[col] = df_orig[col] * expense_growth
-        
-        # Recalcula valores derivados
-        scenario_data = self._recalculate_derived_values(scenario_data)
+            # Custos crescem 80% do que as receitas crescem (eficiência) e
+            # despesas fixas, apenas 50%
+            cost_growth = 1 + (revenue_growth - 1) * 0.8
+            expense_growth = 1 + (revenue_growth - 1) * 0.5
+            
+            for categories, growth in [
+                (self.VARIABLE_COST_CATEGORIES, cost_growth),
+                (self.FIXED_EXPENSE_CATEGORIES, expense_growth)
+            ]:
+                for category in categories:
+                    category_key = category.value
+                    if category_key in scenario_data and category_key in self._soa:
+                        self._apply_column_factors(
+                            scenario_data[category_key], self._soa[category_key], growth
+                        )
+        
+        # Recalcula valores derivados; as receitas não mudam depois do ajuste
+        # acima, então a soma já calculada é reaproveitada
+        scenario_data = self._recalculate_derived_values(scenario_data, revenue_sum=new_revenue)
         
         return scenario_data
     
+    def _apply_adjustments(
+        self, 
+        scenario_data: Dict[str, Dict[str, np.ndarray]],
+        adjustments: List[Tuple[List[FinancialCategory], float]]
+    ) -> None:
+        """
+        Aplica ajustes percentuais aos valores numéricos de grupos de categorias.
+        
+        Args:
+            scenario_data: Colunas do cenário, alteradas no lugar.
+            adjustments: Pares (categorias, ajuste), em que o ajuste é a variação
+                relativa aplicada (ex.: -0.15 para uma redução de 15%).
+        """
+        for categories, adjustment in adjustments:
+            factor = 1 + adjustment
+            for category in categories:
+                columns = scenario_data.get(category.value)
+                if columns is not None:
+                    self._apply_multiplier(columns, factor)
+    
+    def _apply_multiplier(self, columns: Dict[str, np.ndarray], factor: float) -> None:
+        """
+        Multiplica todas as colunas numéricas de uma categoria por um fator.
+        
+        Args:
+            columns: Colunas da categoria, substituídas por novos arrays.
+            factor: Fator multiplicativo.
+        """
+        for col, values in columns.items():
+            columns[col] = self._scaled(values, factor)
+    
+    @staticmethod
+    def _scaled(values: np.ndarray, factor: float) -> np.ndarray:
+        """
+        Multiplica um array por um fator, mantendo o dtype do array.
+        
+        O produto é calculado com a precisão do fator e arredondado para o dtype
+        da coluna, como em uma multiplicação no lugar.
+        
+        Args:
+            values: Valores da coluna (não alterados).
+            factor: Fator multiplicativo.
+            
+        Returns:
+            Novo array com os valores multiplicados.
+        """
+        return np.multiply(values, factor, out=np.empty_like(values))
+    
+    def _apply_column_factors(
+        self, 
+        columns: Dict[str, np.ndarray],
+        source_columns: Dict[str, np.ndarray],
+        factors: np.ndarray
+    ) -> None:
+        """
+        Multiplica cada coluna numérica por seu próprio fator.
+        
+        Args:
+            columns: Colunas de destino, substituídas por novos arrays.
+            source_columns: Colunas com os valores de origem (pode ser o próprio destino).
+            factors: Fator de cada coluna, na ordem das colunas; colunas além do
+                último fator não são alteradas.
+        """
+        for col, factor in zip(list(columns), factors):
+            columns[col] = self._scaled(source_columns[col], factor)
+    
     def _sum_category_values(
         self, 
-        data: Dict[str, pd.DataFrame],
+        data: Dict[str, Dict[str, np.ndarray]],
         categories: List[FinancialCategory]
     ) -> np.ndarray:
         """
         Soma os valores numéricos de uma lista de categorias.
         
         Args:
-            data: Dados financeiros.
+            data: Colunas numéricas de cada categoria.
             categories: Lista de categorias a somar.
             
         Returns:
             Array com a soma por coluna numérica.
         """
-        # Identifica todas as colunas numéricas em todas as categorias
-        numeric_columns = set()
+        # Identifica todas as colunas numéricas em todas as categorias, na
+        # ordem em que aparecem (um set tornaria a ordem dependente do hash),
+        # e a posição de cada coluna de cada categoria no resultado
+        column_positions: Dict[str, int] = {}
+        contributions = []
         for category in categories:
-            category_key = category.value
-            if category_key in data:
-                df = data[category_key]
-                numeric_columns.update(df.select_dtypes(include=['number']).columns)
+            columns = data.get(category.value)
+            if columns:
+                positions = [column_positions.setdefault(col, len(column_positions)) for col in columns]
+                contributions.append((category.value, columns, positions))
         
-        numeric_columns = list(numeric_columns)
-        result = np.zeros(len(numeric_columns))
+        result = np.zeros(len(column_positions))
         
-        # Soma os valores de cada categoria
-        for category in categories:
-            category_key = category.value
-            if category_key in data:
-                df = data[category_key]
-                for i, col in enumerate(numeric_columns):
-                    if col in df.columns:
-                        result[i] += df[col].sum()
+        # Uma única redução por categoria, acumulada nas posições correspondentes
+        for category_key, columns, positions in contributions:
+            result[positions] += self._column_sums(category_key, columns)
         
         return result
     
-    def _recalculate_derived_values(
-        self, 
-        scenario_data: Dict[str, pd.DataFrame]
-    ) -> Dict[str, pd.DataFrame]:
+    def _column_sums(self, category: str, columns: Dict[str, np.ndarray]) -> np.ndarray:
         """
-        Recalcula todos os valores derivados em um cenário.
+        Soma cada coluna de uma categoria, ignorando ausentes.
+        
+        Categorias sem ajustes (todos os arrays ainda são os originais) reutilizam
+        as somas calculadas na normalização dos dados.
         
         Args:
-            scenario_data: Dados do cenário.
+            category: Nome da categoria.
+            columns: Colunas da categoria no cenário.
             
         Returns:
-            Dados do cenário com valores derivados recalculados.
+            Array float64 com a soma de cada coluna, na ordem das colunas.
         """
-        # Identifica as colunas numéricas em comum
-        common_columns = self._find_common_numeric_columns(scenario_data)
-        
-        # Cria ou obtém DataFrames para valores calculados
-        margin_df = self._create_or_get_dataframe(
-            scenario_data,
-            FinancialCategory.CONTRIBUTION_MARGIN.value
+        original = self._soa.get(category, {})
+        unchanged = len(original) == len(columns) and all(
+            original.get(col) is values for col, values in columns.items()
         )
+        if unchanged and category in self._original_sums:
+            return self._original_sums[category]
         
-        cashflow_df = self._create_or_get_dataframe(
-            scenario_data,
-            FinancialCategory.CASH_FLOW.value
-        )
+        return self._nansum_columns(columns)
+    
+    @staticmethod
+    def _nansum_columns(columns: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Soma cada coluna em float64, em uma única redução, ignorando ausentes.
         
-        balance_df = self._create_or_get_dataframe(
-            scenario_data,
-            FinancialCategory.FINAL_BALANCE.value
-        )
+        Args:
+            columns: Colunas a somar.
+            
+        Returns:
+            Array float64 com a soma de cada coluna, na ordem das colunas.
+        """
+        return np.nansum(np.column_stack(list(columns.values())), axis=0, dtype=np.float64)
+    
+    def _recalculate_derived_values(
+        self, 
+        scenario_data: Dict[str, Dict[str, np.ndarray]],
+        revenue_sum: Optional[np.ndarray] = None
+    ) -> Dict[str, Dict[str, np.ndarray]]:
+        """
+        Recalcula todos os valores derivados em um cenário.
+        
+        Args:
+            scenario_data: Colunas do cenário.
+            revenue_sum: Soma das receitas por coluna, se já calculada pelo chamador.
+            
+        Returns:
+            Colunas do cenário com valores derivados recalculados.
+        """
+        # Colunas numéricas em comum, calculadas na normalização
+        common_columns = self._common_numeric_cols
         
         # Calcula a soma das receitas
-        revenue_sum = self._sum_category_values(scenario_data, self.REVENUE_CATEGORIES)
+        if revenue_sum is None:
+            revenue_sum = self._sum_category_values(scenario_data, self.REVENUE_CATEGORIES)
         
         # Calcula a soma dos custos variáveis
         variable_costs_sum = self._sum_category_values(scenario_data, self.VARIABLE_COST_CATEGORIES)
@@ -438,24 +780,27 @@ class ScenarioGenerator:
         # Calcula a soma das despesas fixas
         fixed_expenses_sum = self._sum_category_values(scenario_data, self.FIXED_EXPENSE_CATEGORIES)
         
+        # Margem, fluxo de caixa e saldo reaproveitam um único buffer; cada
+        # categoria recebe uma cópia dos valores antes do buffer ser sobrescrito
+        
         # Calcula a margem de contribuição (receitas - custos variáveis)
-        contribution_margin = revenue_sum - variable_costs_sum
+        values = np.subtract(revenue_sum, variable_costs_sum)
+        self._update_derived_columns(
+            scenario_data, FinancialCategory.CONTRIBUTION_MARGIN.value, common_columns, values
+        )
         
         # Calcula o fluxo de caixa (margem - despesas fixas)
-        cashflow = contribution_margin - fixed_expenses_sum
+        same_shape = np.broadcast_shapes(values.shape, fixed_expenses_sum.shape) == values.shape
+        values = np.subtract(values, fixed_expenses_sum, out=values if same_shape else None)
+        self._update_derived_columns(
+            scenario_data, FinancialCategory.CASH_FLOW.value, common_columns, values
+        )
         
         # Calcula o saldo final (acumulado do fluxo de caixa)
-        balance = np.cumsum(cashflow)
-        
-        # Atualiza os DataFrames calculados
-        self._update_dataframe_with_values(margin_df, common_columns, contribution_margin)
-        self._update_dataframe_with_values(cashflow_df, common_columns, cashflow)
-        self._update_dataframe_with_values(balance_df, common_columns, balance)
-        
-        # Atualiza os dados do cenário
-        scenario_data[FinancialCategory.CONTRIBUTION_MARGIN.value] = margin_df
-        scenario_data[FinancialCategory.CASH_FLOW.value] = cashflow_df
-        scenario_data[FinancialCategory.FINAL_BALANCE.value] = balance_df
+        np.cumsum(values, out=values)
+        self._update_derived_columns(
+            scenario_data, FinancialCategory.FINAL_BALANCE.value, common_columns, values
+        )
         
         return scenario_data
     
@@ -472,183 +817,203 @@ class ScenarioGenerator:
         Returns:
             Lista de nomes de colunas numéricas comuns.
         """
-        all_numeric_columns = {}
+        all_numeric_columns = []
         
         # Coleta todas as colunas numéricas de todas as categorias
         for category, df in scenario_data.items():
             if not isinstance(df, pd.DataFrame) or df.empty:
                 continue
-                
-            numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
-            all_numeric_columns[category] = set(numeric_cols)
+            
+            all_numeric_columns.append(self._numeric_columns(category, df))
         
         # Se não tiver categorias, retorna lista vazia
         if not all_numeric_columns:
             return []
         
-        # Encontra colunas em comum
-        common_columns = set.intersection(*all_numeric_columns.values()) if all_numeric_columns else set()
+        # Encontra colunas em comum, mantendo a ordem da primeira categoria
+        common_columns = set(all_numeric_columns[0]).intersection(*all_numeric_columns[1:])
         
-        return list(common_columns)
+        return [col for col in all_numeric_columns[0] if col in common_columns]
     
-    def _create_or_get_dataframe(
-        self, 
-        scenario_data: Dict[str, pd.DataFrame],
-        category: str
-    ) -> pd.DataFrame:
+    def _row_count(self, category: str) -> int:
         """
-        Cria um novo DataFrame ou obtém um existente para uma categoria.
+        Retorna o número de linhas do DataFrame de uma categoria.
+        
+        Categorias calculadas ausentes dos dados de entrada usam o modelo
+        preparado na normalização.
         
         Args:
-            scenario_data: Dados do cenário.
             category: Nome da categoria.
             
         Returns:
-            DataFrame para a categoria.
+            Número de linhas.
         """
-        if category in scenario_data and isinstance(scenario_data[category], pd.DataFrame):
-            return scenario_data[category]
-        
-        # Busca um DataFrame existente para usar como modelo
-        template_df = None
-        for df in scenario_data.values():
-            if isinstance(df, pd.DataFrame) and not df.empty:
-                template_df = df
-                break
-        
-        if template_df is None:
-            # Sem modelo, cria DataFrame vazio
-            return pd.DataFrame()
-        
-        # Cria DataFrame com a mesma estrutura
-        df = pd.DataFrame(index=template_df.index)
-        
-        # Copia colunas não numéricas
-        for col in template_df.columns:
-            if not pd.api.types.is_numeric_dtype(template_df[col]):
-                df[col] = template_df[col]
-        
-        return df
+        df = self.financial_data.get(category)
+        if df is None:
+            df = self._template_non_numeric
+        return len(df) if df is not None else 0
     
-    def _update_dataframe_with_values(
+    def _update_derived_columns(
         self, 
-        df: pd.DataFrame,
+        scenario_data: Dict[str, Dict[str, np.ndarray]],
+        category: str,
         columns: List[str],
         values: np.ndarray
     ) -> None:
         """
-        Atualiza um DataFrame com valores calculados.
+        Atualiza as colunas de uma categoria calculada com os valores por coluna.
         
         Args:
-            df: DataFrame a atualizar.
+            scenario_data: Colunas do cenário, alteradas no lugar.
+            category: Categoria calculada.
             columns: Lista de colunas a atualizar.
             values: Valores calculados.
         """
+        category_columns = dict(scenario_data.get(category, {}))
+        scenario_data[category] = category_columns
+        
         if not columns or len(values) == 0:
             return
-            
+        
         # Ajusta o tamanho dos valores se necessário
         if len(values) > len(columns):
             values = values[:len(columns)]
         elif len(values) < len(columns):
             values = np.pad(values, (0, len(columns) - len(values)))
         
-        # Atualiza as colunas
-        for i, col in enumerate(columns):
-            if i < len(values):
-                # Se for uma série temporal, distribui o valor
-                if len(df) > 1 and values.ndim == 1:
-                    # Distribui o valor igualmente para cada linha
-                    df[col] = values[i] / len(df)
-                else:
-                    # Atribui o valor diretamente
-                    df[col] = values[i]
+        # Se for uma série temporal, distribui o valor igualmente para cada linha
+        n_rows = self._row_count(category)
+        if n_rows > 1:
+            values = values / n_rows
+        
+        for col, value in zip(columns, values.astype(np.float64)):
+            category_columns[col] = np.full(n_rows, value, dtype=np.float64)
+    
+    def _build_dataframes(
+        self, 
+        scenario_data: Dict[str, Dict[str, np.ndarray]]
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Monta os DataFrames do cenário a partir das colunas calculadas.
+        
+        Categorias sem ajustes compartilham o DataFrame de entrada, sem cópia.
+        As demais partem de uma cópia do DataFrame de entrada (ou do modelo,
+        para categorias calculadas novas) e recebem, em uma única atribuição de
+        bloco, apenas as colunas cujos arrays foram substituídos.
+        
+        Args:
+            scenario_data: Colunas numéricas de cada categoria do cenário.
+            
+        Returns:
+            DataFrames do cenário, na ordem das categorias.
+        """
+        frames = {}
+        
+        for category, columns in scenario_data.items():
+            original = self._soa.get(category, {})
+            changed = [col for col, values in columns.items() if original.get(col) is not values]
+            
+            source = self.financial_data.get(category)
+            if source is not None and not changed:
+                frames[category] = source
+                continue
+            
+            if source is None:
+                source = self._template_non_numeric
+            df = source.copy() if source is not None else pd.DataFrame()
+            
+            if changed:
+                df[changed] = np.column_stack([columns[col] for col in changed])
+            
+            frames[category] = df
+        
+        return frames
+    
+    def _category_block(self, scenario_data: Dict[str, Dict[str, np.ndarray]], category: str) -> np.ndarray:
+        """
+        Retorna o bloco numérico (linhas x colunas) de uma categoria do cenário.
+        
+        Args:
+            scenario_data: Colunas do cenário.
+            category: Nome da categoria.
+            
+        Returns:
+            Matriz float64 com as colunas numéricas; vazia se a categoria não existir.
+        """
+        columns = scenario_data.get(category)
+        if not columns:
+            return np.empty((0, 0))
+        return np.column_stack(list(columns.values())).astype(np.float64)
+    
+    def _category_total(self, scenario_data: Dict[str, Dict[str, np.ndarray]], category: str) -> float:
+        """
+        Soma todos os valores numéricos de uma categoria, ignorando ausentes.
+        
+        Args:
+            scenario_data: Colunas do cenário.
+            category: Nome da categoria.
+            
+        Returns:
+            Total da categoria (zero se ela não existir).
+        """
+        return float(np.nansum(self._category_block(scenario_data, category)))
+    
+    def _categories_total(
+        self, 
+        scenario_data: Dict[str, Dict[str, np.ndarray]],
+        categories: List[FinancialCategory]
+    ) -> float:
+        """
+        Soma todos os valores numéricos de um grupo de categorias.
+        
+        Args:
+            scenario_data: Colunas do cenário.
+            categories: Categorias a somar.
+            
+        Returns:
+            Total do grupo.
+        """
+        return sum(self._category_total(scenario_data, category.value) for category in categories)
     
     def _calculate_scenario_metrics(
         self, 
-        scenario_data: Dict[str, pd.DataFrame]
+        scenario_data: Dict[str, Dict[str, np.ndarray]]
     ) -> Dict[str, Any]:
         """
         Calcula métricas importantes do cenário.
         
         Args:
-            scenario_data: Dados do cenário.
+            scenario_data: Colunas do cenário.
             
         Returns:
             Dicionário com métricas calculadas.
         """
         metrics = {
-            "total_revenue": 0,
-            "total_costs": 0,
-            "total_expenses": 0,
-            "total_margin": 0,
-            "total_cashflow": 0,
+            "total_revenue": self._categories_total(scenario_data, self.REVENUE_CATEGORIES),
+            "total_costs": self._categories_total(scenario_data, self.VARIABLE_COST_CATEGORIES),
+            "total_expenses": self._categories_total(scenario_data, self.FIXED_EXPENSE_CATEGORIES),
+            "total_margin": self._category_total(scenario_data, FinancialCategory.CONTRIBUTION_MARGIN.value),
+            "total_cashflow": self._category_total(scenario_data, FinancialCategory.CASH_FLOW.value),
             "final_balance": 0,
             "margin_percentage": 0,
             "roi": 0
         }
         
-        # Calcula métricas de receita
-        for category in self.REVENUE_CATEGORIES:
-            category_key = category.value
-            if category_key in scenario_data:
-                df = scenario_data[category_key]
-                numeric_cols = df.select_dtypes(include=['number']).columns
-                metrics["total_revenue"] += df[numeric_cols].sum().sum()
-        
-        # Calcula métricas de custos
-        for category in self.VARIABLE_COST_CATEGORIES:
-            category_key = category.value
-            if category_key in scenario_data:
-                df = scenario_data[category_key]
-                numeric_cols = df.select_dtypes(include=['number']).columns
-                metrics["total_costs"] += df[numeric_cols].sum().sum()
-        
-        # Calcula métricas de despesas
-        for category in self.FIXED_EXPENSE_CATEGORIES:
-            category_key = category.value
-            if category_key in scenario_data:
-                df = scenario_data[category_key]
-                numeric_cols = df.select_dtypes(include=['number']).columns
-                metrics["total_expenses"] += df[numeric_cols].sum().sum()
-        
-        # Margem de contribuição
-        category_key = FinancialCategory.CONTRIBUTION_MARGIN.value
-        if category_key in scenario_data:
-            df = scenario_data[category_key]
-            numeric_cols = df.select_dtypes(include=['number']).columns
-            metrics["total_margin"] = df[numeric_cols].sum().sum()
-        
-        # Fluxo de caixa
-        category_key = FinancialCategory.CASH_FLOW.value
-        if category_key in scenario_data:
-            df = scenario_data[category_key]
-            numeric_cols = df.select_dtypes(include=['number']).columns
-            metrics["total_cashflow"] = df[numeric_cols].sum().sum()
-        
-        # Saldo final
+        # Saldo final: soma do último valor não nulo de cada coluna
         category_key = FinancialCategory.FINAL_BALANCE.value
-        if category_key in scenario_data:
-            df = scenario_data[category_key]
-            numeric_cols = df.select_dtypes(include=['number']).columns
-            # Pega o último valor não nulo
-            for col in numeric_cols:
-                last_values = df[col].dropna()
-                if not last_values.empty:
-                    metrics["final_balance"] += last_values.iloc[-1]
+        block = self._category_block(scenario_data, category_key)
+        if block.size:
+            has_value = ~np.isnan(block)
+            last_idx = block.shape[0] - 1 - has_value[::-1].argmax(axis=0)
+            last_values = block[last_idx, np.arange(block.shape[1])]
+            metrics["final_balance"] = float(last_values[has_value.any(axis=0)].sum())
         
         # Calcula percentuais
         if metrics["total_revenue"] > 0:
             metrics["margin_percentage"] = (metrics["total_margin"] / metrics["total_revenue"]) * 100
         
         # Calcula ROI
-        total_investment = 0
-        for category in self.INVESTMENT_CATEGORIES:
-            category_key = category.value
-            if category_key in scenario_data:
-                df = scenario_data[category_key]
-                numeric_cols = df.select_dtypes(include=['number']).columns
-                total_investment += df[numeric_cols].sum().sum()
+        total_investment = self._categories_total(scenario_data, self.INVESTMENT_CATEGORIES)
         
         if total_investment > 0:
             metrics["roi"] = (metrics["total_cashflow"] / total_investment) * 100
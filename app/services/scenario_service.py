@@ -11,7 +11,7 @@ import numpy as np
 from typing import Dict, List, Any, Optional, Union, Callable
 from datetime import datetime
 import logging
-from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor
 
 from app.utils.excel_processor import ExcelProcessor, FinancialCategory
 
@@ -42,6 +42,8 @@ class ScenarioGenerator:
         excel_processor (ExcelProcessor): Instância do processador de planilhas Excel.
         financial_data (Dict[str, pd.DataFrame]): Dados financeiros extraídos.
         scenarios (Dict[str, Dict[str, pd.DataFrame]]): Cenários gerados.
+        derived_arrays (Dict[str, Dict[str, np.ndarray]]): Valores das categorias
+            calculadas de cada cenário, um valor por coluna numérica em comum.
         metadata (Dict[str, Any]): Metadados dos cenários gerados.
     """
     
@@ -68,6 +70,9 @@ class ScenarioGenerator:
         FinancialCategory.FINAL_BALANCE
     ]
     
+    # Chaves das categorias calculadas, recalculadas em todo cenário
+    CALCULATED_KEYS = frozenset(category.value for category in CALCULATED_CATEGORIES)
+    
     def __init__(self, excel_processor: ExcelProcessor):
         """
         Inicializa o gerador de cenários.
@@ -84,7 +89,21 @@ class ScenarioGenerator:
         if not self.financial_data:
             raise ValueError("Dados financeiros não extraídos. Execute extract_financial_data() primeiro.")
         
+        # Colunas numéricas de cada categoria de entrada, identificadas uma
+        # única vez; os cenários escalam valores, mas não criam nem removem
+        # colunas dessas categorias. As calculadas ganham colunas no recálculo
+        # e ficam de fora
+        self._numeric_cols: Dict[str, List[str]] = {
+            category: df.select_dtypes(include=['number']).columns.tolist()
+            for category, df in self.financial_data.items()
+            if category not in self.CALCULATED_KEYS
+        }
+        
+        # Colunas em comum usadas nos valores derivados de todos os cenários
+        self._common_numeric_columns = self._find_common_numeric_columns(self.financial_data)
+        
         self.scenarios: Dict[str, Dict[str, pd.DataFrame]] = {}
+        self.derived_arrays: Dict[str, Dict[str, np.ndarray]] = {}
         self.metadata: Dict[str, Any] = {
             "generation_date": datetime.now(),
             "scenarios_generated": [],
@@ -99,9 +118,19 @@ class ScenarioGenerator:
             Dicionário contendo todos os cenários gerados.
         """
         self.generate_realistic_scenario()
-        self.generate_pessimistic_scenario()
-        self.generate_optimistic_scenario()
-        self.generate_aggressive_scenario()
+        
+        # Os demais cenários só leem o realista e são independentes entre si;
+        # cada tarefa devolve seus dados e o registro é feito nesta thread, na
+        # ordem de apresentação
+        builders = [
+            (ScenarioType.PESSIMISTIC, self._build_pessimistic_scenario),
+            (ScenarioType.OPTIMISTIC, self._build_optimistic_scenario),
+            (ScenarioType.AGGRESSIVE, self._build_aggressive_scenario)
+        ]
+        with ThreadPoolExecutor(max_workers=len(builders)) as executor:
+            futures = [(scenario_type, executor.submit(build)) for scenario_type, build in builders]
+            for scenario_type, future in futures:
+                self.scenarios[scenario_type] = future.result()
         
         self.metadata["scenarios_generated"] = list(self.scenarios.keys())
         
@@ -120,12 +149,13 @@ class ScenarioGenerator:
         # Inicia um novo dicionário para o cenário
         scenario_data = {}
         
-        # Copia todas as categorias originais
+        # Copia todas as categorias originais. As calculadas só têm colunas
+        # substituídas pelo recálculo, então basta uma cópia rasa delas
         for category, df in self.financial_data.items():
-            scenario_data[category] = df.copy(deep=True)
+            scenario_data[category] = df.copy(deep=category not in self.CALCULATED_KEYS)
         
         # Recalcula os valores derivados
-        scenario_data = self._recalculate_derived_values(scenario_data)
+        scenario_data = self._recalculate_derived_values(scenario_data, ScenarioType.REALISTIC)
         
         # Adiciona aos cenários
         self.scenarios[ScenarioType.REALISTIC] = scenario_data
@@ -143,38 +173,43 @@ class ScenarioGenerator:
         Returns:
             Dicionário contendo as categorias financeiras do cenário pessimista.
         """
-        # Inicia com uma cópia do cenário realista
+        # O cenário parte de uma cópia do cenário realista
         if ScenarioType.REALISTIC not in self.scenarios:
             self.generate_realistic_scenario()
         
-        scenario_data = deepcopy(self.scenarios[ScenarioType.REALISTIC])
+        # Monta e adiciona aos cenários
+        scenario_data = self._build_pessimistic_scenario()
+        self.scenarios[ScenarioType.PESSIMISTIC] = scenario_data
+        
+        return scenario_data
+    
+    def _build_pessimistic_scenario(self) -> Dict[str, pd.DataFrame]:
+        """
+        Monta o cenário pessimista a partir do cenário realista, já gerado.
+        
+        Não altera self.scenarios, podendo ser executado em paralelo com a
+        montagem dos demais cenários.
+        
+        Returns:
+            Dicionário contendo as categorias financeiras do cenário pessimista.
+        """
+        # Inicia com uma cópia do cenário realista
+        scenario_data = self._clone_scenario(
+            self.scenarios[ScenarioType.REALISTIC],
+            self.REVENUE_CATEGORIES + self.VARIABLE_COST_CATEGORIES + self.FIXED_EXPENSE_CATEGORIES
+        )
         
         # Reduz receitas em 15%
-        for category in self.REVENUE_CATEGORIES:
-            if category.value in scenario_data:
-                df = scenario_data[category.value]
-                numeric_cols = df.select_dtypes(include=['number']).columns
-                df[numeric_cols] = df[numeric_cols] * 0.85  # redução de 15%
+        self._scale_categories(scenario_data, self.REVENUE_CATEGORIES, 0.85)
         
         # Aumenta custos variáveis em 10%
-        for category in self.VARIABLE_COST_CATEGORIES:
-            if category.value in scenario_data:
-                df = scenario_data[category.value]
-                numeric_cols = df.select_dtypes(include=['number']).columns
-                df[numeric_cols] = df[numeric_cols] * 1.10  # aumento de 10%
+        self._scale_categories(scenario_data, self.VARIABLE_COST_CATEGORIES, 1.10)
         
         # Aumenta despesas fixas em 10%
-        for category in self.FIXED_EXPENSE_CATEGORIES:
-            if category.value in scenario_data:
-                df = scenario_data[category.value]
-                numeric_cols = df.select_dtypes(include=['number']).columns
-                df[numeric_cols] = df[numeric_cols] * 1.10  # aumento de 10%
+        self._scale_categories(scenario_data, self.FIXED_EXPENSE_CATEGORIES, 1.10)
         
         # Recalcula os valores derivados
-        scenario_data = self._recalculate_derived_values(scenario_data)
-        
-        # Adiciona aos cenários
-        self.scenarios[ScenarioType.PESSIMISTIC] = scenario_data
+        scenario_data = self._recalculate_derived_values(scenario_data, ScenarioType.PESSIMISTIC)
         
         return scenario_data
     
@@ -189,38 +224,43 @@ class ScenarioGenerator:
         Returns:
             Dicionário contendo as categorias financeiras do cenário otimista.
         """
-        # Inicia com uma cópia do cenário realista
+        # O cenário parte de uma cópia do cenário realista
         if ScenarioType.REALISTIC not in self.scenarios:
             self.generate_realistic_scenario()
         
-        scenario_data = deepcopy(self.scenarios[ScenarioType.REALISTIC])
+        # Monta e adiciona aos cenários
+        scenario_data = self._build_optimistic_scenario()
+        self.scenarios[ScenarioType.OPTIMISTIC] = scenario_data
+        
+        return scenario_data
+    
+    def _build_optimistic_scenario(self) -> Dict[str, pd.DataFrame]:
+        """
+        Monta o cenário otimista a partir do cenário realista, já gerado.
+        
+        Não altera self.scenarios, podendo ser executado em paralelo com a
+        montagem dos demais cenários.
+        
+        Returns:
+            Dicionário contendo as categorias financeiras do cenário otimista.
+        """
+        # Inicia com uma cópia do cenário realista
+        scenario_data = self._clone_scenario(
+            self.scenarios[ScenarioType.REALISTIC],
+            self.REVENUE_CATEGORIES + self.VARIABLE_COST_CATEGORIES + self.FIXED_EXPENSE_CATEGORIES
+        )
         
         # Aumenta receitas em 20%
-        for category in self.REVENUE_CATEGORIES:
-            if category.value in scenario_data:
-                df = scenario_data[category.value]
-                numeric_cols = df.select_dtypes(include=['number']).columns
-                df[numeric_cols] = df[numeric_cols] * 1.20  # aumento de 20%
+        self._scale_categories(scenario_data, self.REVENUE_CATEGORIES, 1.20)
         
         # Reduz custos variáveis em 5%
-        for category in self.VARIABLE_COST_CATEGORIES:
-            if category.value in scenario_data:
-                df = scenario_data[category.value]
-                numeric_cols = df.select_dtypes(include=['number']).columns
-                df[numeric_cols] = df[numeric_cols] * 0.95  # redução de 5%
+        self._scale_categories(scenario_data, self.VARIABLE_COST_CATEGORIES, 0.95)
         
         # Reduz despesas fixas em 5%
-        for category in self.FIXED_EXPENSE_CATEGORIES:
-            if category.value in scenario_data:
-                df = scenario_data[category.value]
-                numeric_cols = df.select_dtypes(include=['number']).columns
-                df[numeric_cols] = df[numeric_cols] * 0.95  # redução de 5%
+        self._scale_categories(scenario_data, self.FIXED_EXPENSE_CATEGORIES, 0.95)
         
         # Recalcula os valores derivados
-        scenario_data = self._recalculate_derived_values(scenario_data)
-        
-        # Adiciona aos cenários
-        self.scenarios[ScenarioType.OPTIMISTIC] = scenario_data
+        scenario_data = self._recalculate_derived_values(scenario_data, ScenarioType.OPTIMISTIC)
         
         return scenario_data
     
@@ -237,113 +277,198 @@ class ScenarioGenerator:
         Returns:
             Dicionário contendo as categorias financeiras do cenário agressivo.
         """
-        # Inicia com uma cópia do cenário realista
+        # O cenário parte de uma cópia do cenário realista
         if ScenarioType.REALISTIC not in self.scenarios:
             self.generate_realistic_scenario()
         
-        scenario_data = deepcopy(self.scenarios[ScenarioType.REALISTIC])
+        # Monta e adiciona aos cenários
+        scenario_data = self._build_aggressive_scenario()
+        self.scenarios[ScenarioType.AGGRESSIVE] = scenario_data
         
-        # Crescimento exponencial das receitas
-        for category in self.REVENUE_CATEGORIES:
-            if category.value in scenario_data:
-                df = scenario_data[category.value]
-                numeric_cols = df.select_dtypes(include=['number']).columns
-                
-                # Aplica crescimento exponencial
-                for i, col in enumerate(numeric_cols):
-                    # Começa com 30% e adiciona 5% a cada período
-                    growth_factor = 1.30 + (i * 0.05)
-                    df[col] = df[col] * growth_factor
+        return scenario_data
+    
+    def _build_aggressive_scenario(self) -> Dict[str, pd.DataFrame]:
+        """
+        Monta o cenário agressivo a partir do cenário realista, já gerado.
         
-        # Aumenta investimentos em 25%
-        for category in self.INVESTMENT_CATEGORIES:
-            if category.value in scenario_data:
-                df = scenario_data[category.value]
-                numeric_cols = df.select_dtypes(include=['number']).columns
-                df[numeric_cols] = df[numeric_cols] * 1.25  # aumento de 25%
+        Não altera self.scenarios, podendo ser executado em paralelo com a
+        montagem dos demais cenários.
         
-        # Ajusta custos variáveis para crescer proporcionalmente às receitas, mas com eficiência
-        revenue_growth = self._calculate_category_growth(
-            original_data=self.scenarios[ScenarioType.REALISTIC],
-            modified_data=scenario_data,
-            categories=self.REVENUE_CATEGORIES
+        Returns:
+            Dicionário contendo as categorias financeiras do cenário agressivo.
+        """
+        # Inicia com uma cópia do cenário realista
+        scenario_data = self._clone_scenario(
+            self.scenarios[ScenarioType.REALISTIC],
+            self.REVENUE_CATEGORIES + self.INVESTMENT_CATEGORIES
+            + self.VARIABLE_COST_CATEGORIES + self.FIXED_EXPENSE_CATEGORIES
         )
         
-        for category in self.VARIABLE_COST_CATEGORIES:
+        # Crescimento exponencial das receitas. O crescimento de cada coluna é
+        # o próprio fator aplicado, exceto nas colunas sem soma original
+        # positiva, que são consideradas sem crescimento
+        revenue_growth = []
+        for category in self.REVENUE_CATEGORIES:
             if category.value in scenario_data:
                 df = scenario_data[category.value]
-                numeric_cols = df.select_dtypes(include=['number']).columns
+                numeric_cols = self._numeric_columns(category.value, df)
+                if not numeric_cols:
+                    continue
                 
-                # Aplica 80% do crescimento das receitas aos custos variáveis
-                for i, col in enumerate(numeric_cols):
-                    if i < len(revenue_growth):
-                        # Eficiência: apenas 80% do crescimento das receitas impacta os custos
-                        cost_growth = 1 + ((revenue_growth[i] - 1) * 0.8)
-                        df[col] = self.scenarios[ScenarioType.REALISTIC][category.value][col] * cost_growth
-        
-        # Despesas fixas crescem mais lentamente (50% do crescimento das receitas)
-        for category in self.FIXED_EXPENSE_CATEGORIES:
-            if category.value in scenario_data:
-                df = scenario_data[category.value]
-                numeric_cols = df.select_dtypes(include=['number']).columns
+                # Aplica crescimento exponencial: começa com 30% e adiciona 5%
+                # a cada período
+                growth_factors = 1.30 + np.arange(len(numeric_cols)) * 0.05
+                original_sum = df[numeric_cols].to_numpy(dtype=np.float64, na_value=0.0).sum(axis=0)
+                self._apply_column_factors(df, df, numeric_cols, growth_factors)
                 
-                # Aplica 50% do crescimento das receitas às despesas fixas
-                for i, col in enumerate(numeric_cols):
-                    if i < len(revenue_growth):
-                        # Apenas 50% do crescimento das receitas impacta as despesas fixas
-                        expense_growth = 1 + ((revenue_growth[i] - 1) * 0.5)
-                        df[col] = self.scenarios[ScenarioType.REALISTIC][category.value][col] * expense_growth
+                revenue_growth.append(np.where(original_sum > 0, growth_factors, 1.0))
         
-        # Recalcula os valores derivados
-        scenario_data = self._recalculate_derived_values(scenario_data)
+        # Aumenta investimentos em 25%
+        self._scale_categories(scenario_data, self.INVESTMENT_CATEGORIES, 1.25)
         
-        # Adiciona aos cenários
-        self.scenarios[ScenarioType.AGGRESSIVE] = scenario_data
+        # Ajusta custos variáveis para crescer proporcionalmente às receitas, mas com eficiência
+        revenue_growth = np.concatenate(revenue_growth) if revenue_growth else np.ones(1)
+        
+        # Eficiência: apenas 80% do crescimento das receitas impacta os custos
+        # variáveis, e apenas 50% as despesas fixas, que crescem mais lentamente
+        for categories, growth_factors in [
+            (self.VARIABLE_COST_CATEGORIES, 1 + (revenue_growth - 1) * 0.8),
+            (self.FIXED_EXPENSE_CATEGORIES, 1 + (revenue_growth - 1) * 0.5)
+        ]:
+            for category in categories:
+                if category.value in scenario_data:
+                    df = scenario_data[category.value]
+                    numeric_cols = self._numeric_columns(category.value, df)
+                    self._apply_column_factors(
+                        df,
+                        self.scenarios[ScenarioType.REALISTIC][category.value],
+                        numeric_cols,
+                        growth_factors
+                    )
+        
+        # Recalcula os valores derivados
+        scenario_data = self._recalculate_derived_values(scenario_data, ScenarioType.AGGRESSIVE)
         
         return scenario_data
     
-    def _calculate_category_growth(
+    def _clone_scenario(
         self,
-        original_data: Dict[str, pd.DataFrame],
-        modified_data: Dict[str, pd.DataFrame],
-        categories: List[FinancialCategory]
-    ) -> List[float]:
+        scenario_data: Dict[str, pd.DataFrame],
+        mutated_categories: List[FinancialCategory]
+    ) -> Dict[str, pd.DataFrame]:
         """
-        Calcula o fator de crescimento entre os dados originais e modificados para uma categoria.
+        Copia um cenário para servir de base a outro.
+        
+        Apenas as categorias alteradas pelo novo cenário e as categorias
+        calculadas (atualizadas no lugar por _recalculate_derived_values) são
+        copiadas; as demais são compartilhadas, pois nunca são modificadas.
         
         Args:
-            original_data: Dados originais
-            modified_data: Dados modificados
-            categories: Lista de categorias a considerar
+            scenario_data: Cenário de origem.
+            mutated_categories: Categorias que o novo cenário vai alterar.
             
         Returns:
-            Lista de fatores de crescimento por coluna numérica
+            Novo dicionário de DataFrames do cenário.
         """
-        growth_factors = []
+        copied = self.CALCULATED_KEYS.union(category.value for category in mutated_categories)
         
+        return {
+            category: df.copy(deep=True) if category in copied else df
+            for category, df in scenario_data.items()
+        }
+    
+    def _numeric_columns(self, category: str, df: pd.DataFrame) -> List[str]:
+        """
+        Retorna as colunas numéricas de uma categoria.
+        
+        Args:
+            category: Nome da categoria.
+            df: DataFrame da categoria, inspecionado quando a categoria não
+                está em cache (categorias calculadas ou externas).
+            
+        Returns:
+            Lista de nomes de colunas numéricas.
+        """
+        numeric_cols = self._numeric_cols.get(category)
+        if numeric_cols is None:
+            numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
+        return numeric_cols
+    
+    def _scale_categories(
+        self,
+        scenario_data: Dict[str, pd.DataFrame],
+        categories: List[FinancialCategory],
+        factor: float
+    ) -> None:
+        """
+        Multiplica as colunas numéricas de um grupo de categorias por um fator.
+        
+        Cada categoria é escalada em uma única multiplicação sobre o bloco
+        NumPy de suas colunas, em vez da aritmética de DataFrame coluna a coluna.
+        
+        Args:
+            scenario_data: Dados do cenário, alterados no lugar.
+            categories: Categorias a escalar.
+            factor: Fator multiplicativo.
+        """
         for category in categories:
-            if category.value in original_data and category.value in modified_data:
-                orig_df = original_data[category.value]
-                mod_df = modified_data[category.value]
-                
-                numeric_cols = orig_df.select_dtypes(include=['number']).columns
-                
-                for col in numeric_cols:
-                    orig_sum = orig_df[col].sum()
-                    mod_sum = mod_df[col].sum()
-                    
-                    if orig_sum > 0:
-                        growth_factor = mod_sum / orig_sum
-                    else:
-                        growth_factor = 1.0
-                    
-                    growth_factors.append(growth_factor)
+            if category.value in scenario_data:
+                df = scenario_data[category.value]
+                numeric_cols = self._numeric_columns(category.value, df)
+                if numeric_cols:
+                    df[numeric_cols] = self._scaled_block(df, numeric_cols, factor)
+    
+    def _apply_column_factors(
+        self,
+        df: pd.DataFrame,
+        source_df: pd.DataFrame,
+        numeric_cols: List[str],
+        factors: np.ndarray
+    ) -> None:
+        """
+        Multiplica cada coluna numérica por seu fator, em uma única operação.
+        
+        Args:
+            df: DataFrame de destino, alterado no lugar.
+            source_df: DataFrame com os valores de origem (pode ser o próprio df).
+            numeric_cols: Colunas numéricas, na ordem dos fatores.
+            factors: Fator de cada coluna; colunas além do último fator não são alteradas.
+        """
+        n_cols = min(len(numeric_cols), len(factors))
+        if n_cols:
+            columns = numeric_cols[:n_cols]
+            df[columns] = self._scaled_block(source_df, columns, factors[:n_cols])
+    
+    @staticmethod
+    def _scaled_block(
+        df: pd.DataFrame,
+        columns: List[str],
+        factors: Union[float, np.ndarray]
+    ) -> np.ndarray:
+        """
+        Multiplica colunas numéricas por fatores em uma única passagem.
         
-        return growth_factors if growth_factors else [1.0]
+        O produto é gravado direto em uma nova matriz, sem copiar os valores
+        antes. Colunas de ponto flutuante mantêm seu tipo e colunas inteiras
+        são convertidas para float64, o mesmo resultado da multiplicação por
+        um fator fracionário.
+        
+        Args:
+            df: DataFrame de origem, que não é alterado.
+            columns: Colunas a multiplicar.
+            factors: Fator único ou um fator por coluna.
+            
+        Returns:
+            Matriz (linhas x colunas) própria com os valores escalados.
+        """
+        values = df[columns].to_numpy()
+        dtype = values.dtype if values.dtype.kind == 'f' else np.float64
+        return np.multiply(values, factors, out=np.empty(values.shape, dtype=dtype))
     
     def _recalculate_derived_values(
         self, 
-        scenario_data: Dict[str, pd.DataFrame]
+        scenario_data: Dict[str, pd.DataFrame],
+        scenario_type: Optional[str] = None
     ) -> Dict[str, pd.DataFrame]:
         """
         Recalcula todos os valores derivados em um cenário.
@@ -358,12 +483,15 @@ class ScenarioGenerator:
         
         Args:
             scenario_data: Dados do cenário a serem recalculados
+            scenario_type: Tipo do cenário; se informado, os valores derivados
+                também são registrados em self.derived_arrays
             
         Returns:
             Cenário com valores derivados recalculados
         """
-        # 1. Identifica as colunas numéricas em comum entre todas as categorias
-        common_columns = self._find_common_numeric_columns(scenario_data)
+        # 1. Colunas numéricas em comum entre todas as categorias, identificadas
+        # na inicialização (os cenários não alteram a estrutura dos dados)
+        common_columns = self._common_numeric_columns
         
         # 2. Cria ou atualiza o DataFrame de Margem de Contribuição
         margin_df = self._create_or_get_dataframe(
@@ -371,32 +499,21 @@ class ScenarioGenerator:
             FinancialCategory.CONTRIBUTION_MARGIN.value
         )
         
-        # 3. Calcula a ENTRADA OPERACIONAL (soma das receitas)
-        revenue_sum = self._sum_category_values(
-            scenario_data, 
-            self.REVENUE_CATEGORIES, 
-            common_columns
-        )
-        
-        # 4. Calcula as SAÍDAS VARIÁVEIS (soma dos custos variáveis)
-        variable_costs_sum = self._sum_category_values(
-            scenario_data, 
-            self.VARIABLE_COST_CATEGORIES, 
-            common_columns
-        )
-        
-        # 5. Calcula as SAÍDAS FIXAS (soma das despesas fixas)
-        fixed_expenses_sum = self._sum_category_values(
-            scenario_data, 
-            self.FIXED_EXPENSE_CATEGORIES, 
+        # 3-5. Calcula, em uma única passagem pelas categorias, a ENTRADA
+        # OPERACIONAL (receitas), as SAÍDAS VARIÁVEIS (custos variáveis) e as
+        # SAÍDAS FIXAS (despesas fixas)
+        revenue_sum, variable_costs_sum, fixed_expenses_sum = self._sum_category_groups(
+            scenario_data,
+            [self.REVENUE_CATEGORIES, self.VARIABLE_COST_CATEGORIES, self.FIXED_EXPENSE_CATEGORIES],
             common_columns
         )
         
-        # 6. Calcula MARGEM DE CONTRIBUIÇÃO (ENTRADAS - SAÍDAS VARIÁVEIS)
-        contribution_margin = revenue_sum - variable_costs_sum
+        # 6. Calcula MARGEM DE CONTRIBUIÇÃO (ENTRADAS - SAÍDAS VARIÁVEIS),
+        # reaproveitando a linha dos custos variáveis
+        contribution_margin = np.subtract(revenue_sum, variable_costs_sum, out=variable_costs_sum)
         
         # Atualiza o DataFrame de Margem
-        self._update_dataframe_with_values(
+        margin_values = self._update_dataframe_with_values(
             margin_df, 
             common_columns, 
             contribution_margin
@@ -408,11 +525,12 @@ class ScenarioGenerator:
             FinancialCategory.CASH_FLOW.value
         )
         
-        # 8. Calcula FDC (MARGEM - SAÍDAS FIXAS)
-        cashflow = contribution_margin - fixed_expenses_sum
+        # 8. Calcula FDC (MARGEM - SAÍDAS FIXAS), reaproveitando a linha das
+        # despesas fixas
+        cashflow = np.subtract(contribution_margin, fixed_expenses_sum, out=fixed_expenses_sum)
         
         # Atualiza o DataFrame de Fluxo de Caixa
-        self._update_dataframe_with_values(
+        cashflow_values = self._update_dataframe_with_values(
             cashflow_df, 
             common_columns, 
             cashflow
@@ -424,11 +542,12 @@ class ScenarioGenerator:
             FinancialCategory.FINAL_BALANCE.value
         )
         
-        # 10. Calcula o SALDO FINAL (acumulado dos fluxos de caixa)
-        balance = np.cumsum(cashflow)
+        # 10. Calcula o SALDO FINAL (acumulado dos fluxos de caixa) no próprio
+        # buffer do fluxo de caixa, cujo DataFrame já foi atualizado
+        balance = np.add.accumulate(cashflow, out=cashflow)
         
         # Atualiza o DataFrame de Saldo Final
-        self._update_dataframe_with_values(
+        balance_values = self._update_dataframe_with_values(
             balance_df, 
             common_columns, 
             balance
@@ -439,6 +558,16 @@ class ScenarioGenerator:
         scenario_data[FinancialCategory.CASH_FLOW.value] = cashflow_df
         scenario_data[FinancialCategory.FINAL_BALANCE.value] = balance_df
         
+        # Registra os valores derivados (um por coluna em comum), consumidos
+        # pelo resumo sem passar pelos DataFrames. Cada cenário grava apenas a
+        # própria chave, mesmo quando gerado em paralelo
+        if scenario_type is not None:
+            self.derived_arrays[scenario_type] = {
+                FinancialCategory.CONTRIBUTION_MARGIN.value: margin_values,
+                FinancialCategory.CASH_FLOW.value: cashflow_values,
+                FinancialCategory.FINAL_BALANCE.value: balance_values
+            }
+        
         return scenario_data
     
     def _find_common_numeric_columns(
@@ -467,21 +596,18 @@ class ScenarioGenerator:
         
         # Identifique colunas numéricas na primeira categoria
         first_category = non_derived_categories[0]
-        numeric_columns = scenario_data[first_category].select_dtypes(include=['number']).columns.tolist()
-        
-        # Verifique quais dessas colunas estão presentes em todas as outras categorias
-        common_columns = []
-        for col in numeric_columns:
-            is_common = True
-            for category in non_derived_categories[1:]:
-                if col not in scenario_data[category].columns or not pd.api.types.is_numeric_dtype(scenario_data[category][col]):
-                    is_common = False
-                    break
-            
-            if is_common:
-                common_columns.append(col)
-        
-        return common_columns
+        numeric_columns = self._numeric_columns(first_category, scenario_data[first_category])
+        
+        # Verifique quais dessas colunas são numéricas em todas as outras categorias
+        other_numeric = [
+            set(self._numeric_columns(category, scenario_data[category]))
+            for category in non_derived_categories[1:]
+        ]
+        
+        return [
+            col for col in numeric_columns
+            if all(col in numeric_set for numeric_set in other_numeric)
+        ]
     
     def _create_or_get_dataframe(
         self, 
@@ -543,16 +669,40 @@ class ScenarioGenerator:
         Returns:
             Array NumPy com as somas
         """
-        # Inicializa array de zeros com o tamanho das colunas
-        result = np.zeros(len(columns))
+        return self._sum_category_groups(scenario_data, [categories], columns)[0]
+    
+    def _sum_category_groups(
+        self, 
+        scenario_data: Dict[str, pd.DataFrame],
+        groups: List[List[FinancialCategory]],
+        columns: List[str]
+    ) -> np.ndarray:
+        """
+        Soma os valores numéricos de vários grupos de categorias de uma só vez.
         
-        for category in categories:
-            if category.value in scenario_data:
-                df = scenario_data[category.value]
-                for i, col in enumerate(columns):
-                    if col in df.columns:
-                        # Soma os valores da coluna (ignora NaN)
-                        result[i] += df[col].sum(skipna=True)
+        Args:
+            scenario_data: Dados do cenário
+            groups: Grupos de categorias; cada grupo gera uma linha do resultado
+            columns: Lista de colunas a serem somadas
+            
+        Returns:
+            Matriz NumPy (grupos x colunas) com as somas
+        """
+        # Inicializa a matriz de zeros e a posição de cada coluna
+        result = np.zeros((len(groups), len(columns)))
+        positions = {col: i for i, col in enumerate(columns)}
+        
+        for row, categories in enumerate(groups):
+            for category in categories:
+                if category.value in scenario_data:
+                    df = scenario_data[category.value]
+                    present = [col for col in columns if col in df.columns]
+                    if not present:
+                        continue
+                    
+                    # Soma todas as colunas em uma única redução (NaN conta como zero)
+                    values = df[present].to_numpy(dtype=np.float64, na_value=0.0)
+                    result[row, [positions[col] for col in present]] += values.sum(axis=0)
         
         return result
     
@@ -561,7 +711,7 @@ class ScenarioGenerator:
         df: pd.DataFrame,
         columns: List[str],
         values: np.ndarray
-    ) -> None:
+    ) -> np.ndarray:
         """
         Atualiza um DataFrame com valores calculados.
         
@@ -569,10 +719,18 @@ class ScenarioGenerator:
             df: DataFrame a ser atualizado
             columns: Lista de colunas a serem atualizadas
             values: Array de valores calculados
+            
+        Returns:
+            Cópia dos valores em float64, como gravados no DataFrame
         """
-        # Adiciona ou atualiza colunas numéricas
-        for i, col in enumerate(columns):
-            df[col] = values[i]
+        # Adiciona ou atualiza colunas numéricas em uma única atribuição: as
+        # colunas são localizadas de uma vez e cada valor é repetido em todas
+        # as linhas
+        values = np.array(values, dtype=np.float64)
+        if columns:
+            df[columns] = np.repeat(values[np.newaxis, :], len(df), axis=0)
+        
+        return values
     
     def export_scenarios_summary(self) -> pd.DataFrame:
         """
@@ -584,8 +742,10 @@ class ScenarioGenerator:
         if not self.scenarios:
             raise ValueError("Nenhum cenário foi gerado. Execute generate_all_scenarios() primeiro.")
         
-        # Cria um DataFrame vazio para o resumo
-        summary = pd.DataFrame()
+        # Blocos (margem, fluxo de caixa, saldo) x colunas de cada cenário,
+        # reunidos em um único DataFrame ao final
+        blocks = []
+        summary_columns = []
         
         # Adiciona entradas para cada cenário
         for scenario_name, scenario_data in self.scenarios.items():
@@ -598,15 +758,33 @@ class ScenarioGenerator:
                 cashflow_df = scenario_data[FinancialCategory.CASH_FLOW.value]
                 balance_df = scenario_data[FinancialCategory.FINAL_BALANCE.value]
                 
-                # Calcula totais
-                numeric_cols = margin_df.select_dtypes(include=['number']).columns
+                # Valores derivados registrados no recálculo: cada coluna em
+                # comum tem o mesmo valor em todas as linhas dos DataFrames
+                derived = self.derived_arrays[scenario_name]
+                block = np.stack([
+                    derived[FinancialCategory.CONTRIBUTION_MARGIN.value],
+                    derived[FinancialCategory.CASH_FLOW.value],
+                    derived[FinancialCategory.FINAL_BALANCE.value]
+                ])
+                
+                # Os totais somam o valor de cada coluna em todas as linhas; o
+                # saldo final é o valor da última linha
+                block[0] *= len(margin_df)
+                block[1] *= len(cashflow_df)
+                if len(balance_df) == 0:
+                    block[2] = 0.0
                 
-                for col in numeric_cols:
-                    summary.loc['Margem Contribuição', f"{scenario_name}_{col}"] = margin_df[col].sum()
-                    summary.loc['Fluxo de Caixa', f"{scenario_name}_{col}"] = cashflow_df[col].sum()
-                    summary.loc['Saldo Final', f"{scenario_name}_{col}"] = balance_df[col].iloc[-1] if len(balance_df) > 0 else 0
+                blocks.append(block)
+                summary_columns.extend(f"{scenario_name}_{col}" for col in self._common_numeric_columns)
         
-        return summary
+        if not summary_columns:
+            return pd.DataFrame()
+        
+        return pd.DataFrame(
+            np.hstack(blocks),
+            index=['Margem Contribuição', 'Fluxo de Caixa', 'Saldo Final'],
+            columns=summary_columns
+        )
     
     def get_scenario_data(self, scenario_type: str) -> Optional[Dict[str, pd.DataFrame]]:
         """
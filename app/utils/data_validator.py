@@ -34,10 +34,11 @@ SCHEMAS = {
             "is_active": bool,
             "role": str,
             "settings": dict,
-            "last_login": (datetime.datetime, type(None))
+            "last_login_ts": int
         },
+        # Padrões compilados uma única vez, na importação do módulo
         "string_patterns": {
-            "email": r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
+            "email": re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
         }
     },
     "financial_data": {
@@ -126,8 +127,8 @@ def validate_data_structure(
     if "string_patterns" in schema:
         for field, pattern in schema["string_patterns"].items():
             if field in document and isinstance(document[field], str):
-                if not re.match(pattern, document[field]):
-                    issues.append(f"Padrão inválido para {field}: '{document[field]}' não corresponde a '{pattern}'")
+                if not pattern.match(document[field]):
+                    issues.append(f"Padrão inválido para {field}: '{document[field]}' não corresponde a '{pattern.pattern}'")
     
     # Validações específicas por coleção
     if collection_name == "financial_data":
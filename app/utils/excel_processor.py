@@ -9,7 +9,10 @@ import os
 import pandas as pd
 import numpy as np
 import io
-from typing import Dict, List, Any, Optional, Union, Tuple, Set, Callable
+import contextlib
+import re
+import warnings
+from typing import Dict, List, Any, Iterator, Optional, Union, Tuple, Set, Callable
 from pathlib import Path
 import logging
 from enum import Enum
@@ -21,6 +24,37 @@ from openpyxl.utils.exceptions import InvalidFileException
 # Configurar logger
 logger = logging.getLogger(__name__)
 
+# Autômato Aho-Corasick para as palavras-chave, quando pyahocorasick estiver
+# instalado; caso contrário, usa-se a expressão regular compilada
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Usa o leitor calamine (Rust, sem árvore DOM) quando disponível;
+# caso contrário, deixa o pandas escolher o engine padrão
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE: Optional[str] = "calamine"
+except ImportError:
+    EXCEL_ENGINE = None
+
+# Com pyarrow instalado, as colunas de texto são lidas em armazenamento Arrow
+# (um buffer contíguo em vez de um objeto Python por célula)
+try:
+    import pyarrow  # noqa: F401
+    ARROW_STRINGS = True
+except ImportError:
+    ARROW_STRINGS = False
+
+# Compilação JIT do cálculo de crescimento, quando numba estiver instalado;
+# caso contrário, usa-se a versão vetorizada em NumPy
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
 
 class ExcelValidationError(Exception):
     """Exceção para erro de validação em arquivos Excel."""
@@ -40,6 +74,122 @@ class FinancialCategory(Enum):
     FINAL_BALANCE = "saldo_final"
 
 
+def _build_keyword_index(
+    category_keywords: Dict[FinancialCategory, List[str]]
+) -> Tuple["re.Pattern[str]", Dict[str, FinancialCategory]]:
+    """
+    Compila as palavras-chave em uma única expressão regular.
+    
+    Args:
+        category_keywords: Mapeamento de categoria para palavras-chave.
+        
+    Returns:
+        Tupla com o padrão compilado e o mapa reverso palavra-chave -> categoria.
+        Quando uma palavra-chave pertence a mais de uma categoria, prevalece a
+        primeira na ordem do mapeamento. O padrão é um lookahead que captura a
+        palavra-chave no grupo 1, então finditer encontra também ocorrências
+        sobrepostas.
+    """
+    keyword_category: Dict[str, FinancialCategory] = {}
+    for category, keywords in category_keywords.items():
+        for keyword in keywords:
+            keyword_category.setdefault(keyword, category)
+    
+    # Palavras-chave mais longas primeiro, para que prevaleçam na mesma posição
+    alternatives = sorted(keyword_category, key=len, reverse=True)
+    pattern = re.compile("(?=(" + "|".join(re.escape(keyword) for keyword in alternatives) + "))")
+    return pattern, keyword_category
+
+
+def _build_keyword_automaton(keyword_category: Dict[str, FinancialCategory]) -> Optional[Any]:
+    """
+    Constrói um autômato Aho-Corasick com as palavras-chave de categoria.
+    
+    Args:
+        keyword_category: Mapa palavra-chave -> categoria.
+        
+    Returns:
+        Autômato pronto para busca ou None se pyahocorasick não estiver disponível.
+    """
+    if ahocorasick is None:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for keyword, category in keyword_category.items():
+        automaton.add_word(keyword, category)
+    automaton.make_automaton()
+    return automaton
+
+
+def _column_growth_numpy(block: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calcula a taxa de crescimento entre o primeiro e o último valor não nulo de cada coluna.
+    
+    Args:
+        block: Matriz 2D (linhas x colunas) de valores float64.
+        
+    Returns:
+        Tupla com as taxas de crescimento (zero quando o primeiro valor é zero) e a
+        máscara das colunas com ao menos dois valores não nulos.
+    """
+    mask = ~np.isnan(block)
+    col_idx = np.arange(block.shape[1])
+    first_idx = mask.argmax(axis=0)
+    last_idx = block.shape[0] - 1 - mask[::-1].argmax(axis=0)
+    firsts = block[first_idx, col_idx]
+    lasts = block[last_idx, col_idx]
+    
+    growth = np.divide(lasts, firsts, out=np.ones_like(firsts), where=firsts != 0) - 1
+    valid = mask.sum(axis=0) >= 2
+    return growth, valid
+
+
+def _column_growth_kernel(block: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Versão em laços explícitos de _column_growth_numpy, destinada ao numba.
+    
+    Percorre cada coluna da frente para trás e de trás para frente até o primeiro
+    valor não nulo, sem alocar máscaras intermediárias.
+    
+    Args:
+        block: Matriz 2D (linhas x colunas) de valores float64.
+        
+    Returns:
+        Tupla com as taxas de crescimento e a máscara de colunas válidas.
+    """
+    n_rows, n_cols = block.shape
+    growth = np.zeros(n_cols)
+    valid = np.zeros(n_cols, dtype=np.bool_)
+    
+    for j in prange(n_cols):
+        first = -1
+        for i in range(n_rows):
+            if not np.isnan(block[i, j]):
+                first = i
+                break
+        if first < 0:
+            continue
+        
+        last = first
+        for i in range(n_rows - 1, first, -1):
+            if not np.isnan(block[i, j]):
+                last = i
+                break
+        if last == first:
+            continue
+        
+        valid[j] = True
+        if block[first, j] != 0:
+            growth[j] = block[last, j] / block[first, j] - 1
+    
+    return growth, valid
+
+
+_column_growth = (
+    njit(cache=True, parallel=True)(_column_growth_kernel) if njit is not None else _column_growth_numpy
+)
+
+
 class ExcelProcessor:
     """
     Processador de arquivos Excel para dados financeiros.
@@ -50,6 +200,8 @@ class ExcelProcessor:
     
     Attributes:
         financial_data (Dict[str, pd.DataFrame]): Dados financeiros extraídos.
+        column_arrays (Dict[str, Dict[str, np.ndarray]]): Colunas numéricas de cada
+            categoria como arrays contíguos, usadas nas análises.
         metadata (Dict[str, Any]): Metadados do arquivo processado.
     """
     
@@ -63,9 +215,56 @@ class ExcelProcessor:
         FinancialCategory.INVESTMENTS: ["investimento", "aquisição", "ativo", "imobilizado"]
     }
     
+    # Padrão único com todas as palavras-chave e mapa reverso para a categoria
+    _KEYWORD_PATTERN, _KEYWORD_CATEGORY = _build_keyword_index(CATEGORY_KEYWORDS)
+    _KEYWORD_AUTOMATON = _build_keyword_automaton(_KEYWORD_CATEGORY)
+    
+    # Prioridade de cada categoria: a ordem de CATEGORY_KEYWORDS
+    _CATEGORY_PRIORITY = {category: priority for priority, category in enumerate(CATEGORY_KEYWORDS)}
+    
+    # Número máximo de linhas inspecionadas ao identificar a categoria pelo conteúdo
+    CONTENT_SAMPLE_ROWS = 200
+    
+    # Padrão para reconhecer colunas de data/período pelo nome (em minúsculas)
+    DATE_COLUMN_PATTERN = r"data|período|m[eê]s"
+    
+    # Formatos de data testados, em ordem, nas colunas de data em texto
+    DATE_FORMATS = ["%Y-%m-%d", "%d/%m/%Y", "%Y-%m", "%m/%Y", "%b/%Y", "%B %Y"]
+    
+    # Número de valores usados para detectar o formato de uma coluna de data
+    DATE_SAMPLE_SIZE = 10
+    
+    # Proporção máxima de valores distintos para codificar texto como categoria
+    CATEGORICAL_MAX_RATIO = 0.5
+    
+    # Se True, uma planilha posterior da mesma categoria substitui a anterior;
+    # caso contrário, prevalece a primeira e as demais não são processadas
+    OVERWRITE_DUPLICATE_CATEGORIES = False
+    
+    # Nomes de apresentação pré-calculados para cada categoria
+    _FORMATTED_NAMES = {
+        cat.value: " ".join(word.capitalize() for word in cat.value.replace("_", " ").split())
+        for cat in FinancialCategory
+    }
+    
+    # Descrições das categorias exibidas na resposta de processamento
+    _DESCRIPTIONS = {
+        FinancialCategory.REVENUE: "Entradas de recursos financeiros",
+        FinancialCategory.VARIABLE_COSTS: "Custos diretos relacionados à operação",
+        FinancialCategory.PERSONNEL_EXPENSES: "Despesas com pessoal e folha de pagamento",
+        FinancialCategory.COMMERCIAL_EXPENSES: "Despesas comerciais e de marketing",
+        FinancialCategory.ADMIN_EXPENSES: "Despesas administrativas e gerais",
+        FinancialCategory.INVESTMENTS: "Aplicações de capital",
+        FinancialCategory.CONTRIBUTION_MARGIN: "Margem de contribuição financeira",
+        FinancialCategory.CASH_FLOW: "Fluxo de caixa operacional",
+        FinancialCategory.FINAL_BALANCE: "Saldo final acumulado"
+    }
+    
     def __init__(self):
         """Inicializa o processador de Excel."""
         self.financial_data: Dict[str, pd.DataFrame] = {}
+        self.column_arrays: Dict[str, Dict[str, np.ndarray]] = {}
+        self._records: Optional[Dict[str, List[Dict[str, Any]]]] = None
         self.metadata: Dict[str, Any] = {
             "processing_date": datetime.now(),
             "sheet_names": [],
@@ -85,24 +284,23 @@ class ExcelProcessor:
         Raises:
             ExcelValidationError: Se o arquivo não atender os requisitos.
         """
-        # Ler o arquivo Excel em memória
+        # Abrir o arquivo Excel em memória (apenas o índice de planilhas)
         try:
-            excel_file = io.BytesIO(content)
-            # Ler todas as planilhas
-            excel_data = pd.read_excel(excel_file, sheet_name=None)
+            excel_file = pd.ExcelFile(io.BytesIO(content), engine=EXCEL_ENGINE)
         except Exception as e:
             logger.error(f"Erro ao ler arquivo Excel: {str(e)}")
             raise ExcelValidationError(f"Erro ao ler arquivo Excel: {str(e)}")
         
-        # Atualizar metadados
-        self.metadata["sheet_names"] = list(excel_data.keys())
-        self.metadata["total_sheets"] = len(excel_data)
-        
-        # Validar a estrutura do arquivo
-        self._validate_excel_structure(excel_data)
-        
-        # Extrair dados financeiros
-        self._extract_financial_data(excel_data)
+        with excel_file:
+            # Atualizar metadados
+            self.metadata["sheet_names"] = list(excel_file.sheet_names)
+            self.metadata["total_sheets"] = len(excel_file.sheet_names)
+            
+            # Validar a estrutura do arquivo
+            self._validate_excel_structure(excel_file.sheet_names)
+            
+            # Extrair dados financeiros, lendo uma planilha por vez
+            self._extract_financial_data(self._iter_sheets(excel_file))
         
         # Validar os dados extraídos
         self._validate_financial_data()
@@ -116,63 +314,129 @@ class ExcelProcessor:
                  "description": self._get_category_description(cat)}
                 for cat in self.metadata.get("categories_found", [])
             ],
-            "data": self.financial_data,
+            "data": self.to_records(),
             "metadata": self.metadata
         }
         
         return response
     
-    def _validate_excel_structure(self, excel_data: Dict[str, pd.DataFrame]) -> None:
+    def _iter_sheets(
+        self, 
+        excel_file: pd.ExcelFile
+    ) -> Iterator[Tuple[str, Callable[[], pd.DataFrame]]]:
+        """
+        Percorre as planilhas do arquivo, adiando a leitura das células.
+        
+        Cada planilha só é lida quando sua função de leitura é chamada, o que
+        permite descartar planilhas apenas pelo nome. Cada DataFrame é liberado
+        antes da leitura do próximo, de modo que o pico de memória corresponde
+        à maior planilha e não à soma de todas.
+        
+        Args:
+            excel_file: Arquivo Excel aberto.
+            
+        Yields:
+            Tuplas com o nome da planilha e a função que lê seu DataFrame.
+        """
+        for sheet_name in excel_file.sheet_names:
+            yield sheet_name, lambda name=sheet_name: self._read_sheet(excel_file, name)
+    
+    def _read_sheet(self, excel_file: pd.ExcelFile, sheet_name: str) -> pd.DataFrame:
+        """
+        Lê uma planilha do arquivo.
+        
+        Args:
+            excel_file: Arquivo Excel aberto.
+            sheet_name: Nome da planilha.
+            
+        Returns:
+            DataFrame com o conteúdo da planilha.
+            
+        Raises:
+            ExcelValidationError: Se a planilha não puder ser lida.
+        """
+        # Apenas o texto usa Arrow: dtype_backend="pyarrow" falha em colunas com
+        # tipos mistos, e as colunas numéricas são convertidas para float64 depois
+        string_storage = (
+            pd.option_context("future.infer_string", True) if ARROW_STRINGS else contextlib.nullcontext()
+        )
+        try:
+            with string_storage:
+                return pd.read_excel(excel_file, sheet_name=sheet_name)
+        except Exception as e:
+            logger.error(f"Erro ao ler arquivo Excel: {str(e)}")
+            raise ExcelValidationError(f"Erro ao ler arquivo Excel: {str(e)}")
+    
+    def _validate_excel_structure(self, sheet_names: List[str]) -> None:
         """
         Valida a estrutura do arquivo Excel.
         
         Args:
-            excel_data: Dicionário com os dados das planilhas.
+            sheet_names: Nomes das planilhas do arquivo.
             
         Raises:
             ExcelValidationError: Se a estrutura não for válida.
         """
-        if not excel_data:
+        if not sheet_names:
             raise ExcelValidationError("O arquivo Excel não contém planilhas.")
-        
-        # Verifica se pelo menos uma planilha tem dados suficientes
-        has_valid_data = False
-        for sheet_name, df in excel_data.items():
-            if not df.empty and df.shape[0] > 0 and df.shape[1] > 0:
-                has_valid_data = True
-                break
-        
-        if not has_valid_data:
-            raise ExcelValidationError("O arquivo Excel não contém dados válidos em nenhuma planilha.")
     
-    def _extract_financial_data(self, excel_data: Dict[str, pd.DataFrame]) -> None:
+    def _extract_financial_data(
+        self, 
+        sheets: Iterator[Tuple[str, Callable[[], pd.DataFrame]]]
+    ) -> None:
         """
         Extrai dados financeiros do arquivo Excel.
         
         Args:
-            excel_data: Dicionário com os dados das planilhas.
+            sheets: Iterador com o nome e a função de leitura de cada planilha.
+            
+        Raises:
+            ExcelValidationError: Se nenhuma planilha contiver dados.
         """
-        # Inicializar contador de categorias encontradas
-        categories_found = set()
+        # Categorias encontradas, na ordem das planilhas
+        categories_found: Dict[FinancialCategory, None] = {}
+        has_valid_data = False
         
         # Processar cada planilha
-        for sheet_name, df in excel_data.items():
+        for sheet_name, read_sheet in sheets:
+            # Planilha cuja categoria, dada pelo nome, já foi processada nem é lida
+            if not self.OVERWRITE_DUPLICATE_CATEGORIES:
+                category = self._match_category(sheet_name.lower())
+                if category in categories_found:
+                    logger.info(f"Planilha '{sheet_name}' ignorada: categoria '{category.value}' já processada")
+                    continue
+            
+            df = read_sheet()
             if df.empty:
                 continue
+            has_valid_data = True
             
             # Tenta identificar a categoria da planilha
             category = self._identify_sheet_category(sheet_name, df)
             
-            if category:
+            # Planilhas repetidas da mesma categoria não são reprocessadas
+            if category in categories_found and not self.OVERWRITE_DUPLICATE_CATEGORIES:
+                logger.info(f"Planilha '{sheet_name}' ignorada: categoria '{category.value}' já processada")
+            elif category:
                 # Processar dados conforme a categoria
                 processed_df = self._process_dataframe_by_category(df, category)
                 
                 # Armazenar dados processados
                 self.financial_data[category.value] = processed_df
-                categories_found.add(category)
+                self.column_arrays[category.value] = self._numeric_arrays(processed_df)
+                categories_found[category] = None
+                del processed_df
                 
                 # Registrar no log
                 logger.info(f"Planilha '{sheet_name}' processada como '{category.value}'")
+            
+            # Solta a referência à planilha antes de ler a próxima, para que
+            # planilhas descartadas não fiquem vivas durante a leitura seguinte
+            del df
+        
+        # Verifica se pelo menos uma planilha tem dados suficientes
+        if not has_valid_data:
+            raise ExcelValidationError("O arquivo Excel não contém dados válidos em nenhuma planilha.")
         
         # Atualizar metadados
         self.metadata["categories_found"] = list(categories_found)
@@ -193,34 +457,49 @@ class ExcelProcessor:
         Returns:
             Categoria financeira identificada ou None.
         """
-        # Converter para minúsculas para facilitar as comparações
-        sheet_name_lower = sheet_name.lower()
-        
         # Verificar se o nome da planilha contém uma palavra-chave de categoria
-        for category, keywords in self.CATEGORY_KEYWORDS.items():
-            if any(keyword in sheet_name_lower for keyword in keywords):
-                return category
+        category = self._match_category(sheet_name.lower())
+        if category:
+            return category
         
-        # Se não encontrou pelo nome da planilha, tenta pelo conteúdo da planilha
-        # Converte todas as colunas de texto para string e concatena
-        text_content = ""
-        for col in df.columns:
-            if df[col].dtype == 'object':
-                text_content += " ".join(df[col].astype(str).tolist())
-                text_content = text_content.lower()
+        # Tenta inferir pelo nome das colunas, sem tocar nos dados
+        columns_text = " ".join(df.columns.astype(str)).lower()
+        category = self._match_category(columns_text)
+        if category:
+            return category
         
-        # Verifica se o conteúdo contém palavras-chave
-        for category, keywords in self.CATEGORY_KEYWORDS.items():
-            if any(keyword in text_content for keyword in keywords):
-                return category
+        # Por último, inspeciona uma amostra das colunas de texto, juntando
+        # todas as células de uma vez e convertendo para minúsculas uma só vez
+        text_df = df.select_dtypes(include=["object", "string"]).head(self.CONTENT_SAMPLE_ROWS)
+        cells = text_df.to_numpy(dtype=object).ravel()
+        text_content = " ".join(cell for cell in cells if isinstance(cell, str)).lower()
         
-        # Tenta inferir pelo nome das colunas
-        columns_text = " ".join(df.columns.astype(str)).lower()
-        for category, keywords in self.CATEGORY_KEYWORDS.items():
-            if any(keyword in columns_text for keyword in keywords):
-                return category
+        return self._match_category(text_content)
+    
+    def _match_category(self, text: str) -> Optional[FinancialCategory]:
+        """
+        Identifica a categoria de um texto pelas palavras-chave.
         
-        return None
+        Entre as categorias com alguma palavra-chave no texto, prevalece a
+        primeira na ordem de CATEGORY_KEYWORDS, seja qual for a posição da
+        palavra-chave no texto.
+        
+        Args:
+            text: Texto em minúsculas.
+            
+        Returns:
+            Categoria de maior prioridade encontrada ou None.
+        """
+        # Uma única passagem linear pelo texto com o autômato, se disponível,
+        # que informa todas as ocorrências, inclusive as sobrepostas
+        if self._KEYWORD_AUTOMATON is not None:
+            categories = {category for _, category in self._KEYWORD_AUTOMATON.iter(text)}
+        else:
+            categories = {
+                self._KEYWORD_CATEGORY[match.group(1)]
+                for match in self._KEYWORD_PATTERN.finditer(text)
+            }
+        return min(categories, key=self._CATEGORY_PRIORITY.__getitem__, default=None)
     
     def _process_dataframe_by_category(
         self, 
@@ -237,34 +516,110 @@ class ExcelProcessor:
         Returns:
             DataFrame processado.
         """
-        # Cópia para evitar modificações no original
-        processed_df = df.copy()
+        # O DataFrame pertence ao processamento da planilha e é descartado em
+        # seguida, então é modificado no lugar em vez de copiado
+        processed_df = df
         
         # Remove linhas totalmente vazias
-        processed_df = processed_df.dropna(how='all')
+        processed_df.dropna(how='all', inplace=True)
         
         # Tenta identificar e padronizar colunas de data/período
-        date_columns = [col for col in processed_df.columns if 
-                         'data' in str(col).lower() or 
-                         'período' in str(col).lower() or 
-                         'mes' in str(col).lower() or
-                         'mês' in str(col).lower()]
+        columns_lower = processed_df.columns.astype(str).str.lower()
+        date_mask = columns_lower.str.contains(self.DATE_COLUMN_PATTERN, regex=True, na=False)
+        date_columns = processed_df.columns[date_mask].tolist()
         
         if date_columns:
             # Padronizar como datetime se possível
             for col in date_columns:
-                try:
-                    processed_df[col] = pd.to_datetime(processed_df[col], errors='coerce')
-                except:
-                    pass  # Mantém como está se não for possível converter
+                column = processed_df[col]
+                if pd.api.types.is_datetime64_any_dtype(column):
+                    continue
+                
+                # Com o formato detectado, o pandas usa o parser rápido em C
+                date_format = self._detect_date_format(column)
+                # Com errors='coerce', valores não interpretáveis viram NaT
+                if date_format:
+                    processed_df[col] = pd.to_datetime(column, format=date_format, errors='coerce', cache=True)
+                else:
+                    processed_df[col] = pd.to_datetime(column, errors='coerce', cache=True)
         
-        # Padronizar colunas numéricas (converte para float)
+        # Padronizar colunas numéricas como float64 em uma única operação por
+        # bloco. Os DataFrames são devolvidos e persistidos, então mantêm a
+        # precisão dos centavos; se já forem float64, a conversão é dispensada
         numeric_columns = processed_df.select_dtypes(include=['number']).columns
-        for col in numeric_columns:
-            processed_df[col] = processed_df[col].astype(float)
+        if len(numeric_columns) and not processed_df[numeric_columns].dtypes.eq(np.float64).all():
+            processed_df[numeric_columns] = processed_df[numeric_columns].astype(np.float64)
+        
+        # Colunas de texto com muitos valores repetidos viram categóricas; em
+        # planilhas só com números não há colunas de texto a procurar
+        if len(numeric_columns) < len(processed_df.columns):
+            for col in processed_df.select_dtypes(include=["object", "string"]).columns:
+                column = processed_df[col]
+                if len(column) and column.nunique() / len(column) < self.CATEGORICAL_MAX_RATIO:
+                    processed_df[col] = column.astype("category")
+        
+        # Guarda as colunas numéricas para não repetir select_dtypes adiante
+        processed_df.attrs["numeric_columns"] = tuple(numeric_columns)
         
         return processed_df
     
+    def _detect_date_format(self, column: pd.Series) -> Optional[str]:
+        """
+        Detecta o formato de uma coluna de datas em texto a partir de uma amostra.
+        
+        Args:
+            column: Coluna com as datas.
+            
+        Returns:
+            Formato de DATE_FORMATS que interpreta mais valores da amostra (o
+            primeiro da lista, em caso de empate) ou None se nenhum servir.
+        """
+        sample = column.dropna().head(self.DATE_SAMPLE_SIZE)
+        if sample.empty or pd.api.types.is_numeric_dtype(sample):
+            return None
+        sample = sample.astype(str)
+        
+        # Células que não são datas (totais, observações) não desqualificam o formato
+        best_format, best_count = None, 0
+        for date_format in self.DATE_FORMATS:
+            parsed_count = pd.to_datetime(sample, format=date_format, errors='coerce').notna().sum()
+            if parsed_count > best_count:
+                best_format, best_count = date_format, parsed_count
+                if parsed_count == len(sample):
+                    break
+        return best_format
+    
+    @staticmethod
+    def _numeric_arrays(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """
+        Decompõe as colunas numéricas de um DataFrame em arrays NumPy.
+        
+        Args:
+            df: DataFrame processado.
+            
+        Returns:
+            Dicionário nome da coluna -> array, na ordem das colunas.
+        """
+        numeric_columns = df.attrs.get("numeric_columns")
+        if numeric_columns is None:
+            numeric_columns = df.select_dtypes(include=['number']).columns
+        return {col: df[col].to_numpy() for col in numeric_columns}
+    
+    def _get_column_arrays(self, category: str) -> Dict[str, np.ndarray]:
+        """
+        Retorna as colunas numéricas de uma categoria, decompondo o DataFrame sob demanda.
+        
+        Args:
+            category: Valor da categoria financeira.
+            
+        Returns:
+            Dicionário nome da coluna -> array.
+        """
+        arrays = self.column_arrays.get(category)
+        if arrays is None:
+            arrays = self.column_arrays[category] = self._numeric_arrays(self.financial_data[category])
+        return arrays
+    
     def _validate_financial_data(self) -> None:
         """
         Valida os dados financeiros extraídos.
@@ -279,10 +634,9 @@ class ExcelProcessor:
             )
         
         # Verificações adicionais para garantir dados coerentes
-        for category, df in self.financial_data.items():
+        for category in self.financial_data:
             # Verificar se há colunas numéricas
-            numeric_columns = df.select_dtypes(include=['number']).columns
-            if len(numeric_columns) == 0:
+            if not self._get_column_arrays(category):
                 raise ExcelValidationError(
                     f"A categoria '{category}' não contém colunas numéricas para análise."
                 )
@@ -297,7 +651,10 @@ class ExcelProcessor:
         Returns:
             Nome formatado.
         """
-        return " ".join(word.capitalize() for word in category_name.replace("_", " ").split())
+        formatted = self._FORMATTED_NAMES.get(category_name)
+        if formatted is None:
+            formatted = " ".join(word.capitalize() for word in category_name.replace("_", " ").split())
+        return formatted
     
     def _get_category_description(self, category: FinancialCategory) -> str:
         """
@@ -309,19 +666,7 @@ class ExcelProcessor:
         Returns:
             Descrição da categoria.
         """
-        descriptions = {
-            FinancialCategory.REVENUE: "Entradas de recursos financeiros",
-            FinancialCategory.VARIABLE_COSTS: "Custos diretos relacionados à operação",
-            FinancialCategory.PERSONNEL_EXPENSES: "Despesas com pessoal e folha de pagamento",
-            FinancialCategory.COMMERCIAL_EXPENSES: "Despesas comerciais e de marketing",
-            FinancialCategory.ADMIN_EXPENSES: "Despesas administrativas e gerais",
-            FinancialCategory.INVESTMENTS: "Aplicações de capital",
-            FinancialCategory.CONTRIBUTION_MARGIN: "Margem de contribuição financeira",
-            FinancialCategory.CASH_FLOW: "Fluxo de caixa operacional",
-            FinancialCategory.FINAL_BALANCE: "Saldo final acumulado"
-        }
-        
-        return descriptions.get(category, "Categoria financeira")
+        return self._DESCRIPTIONS.get(category, "Categoria financeira")
     
     def analyze_trends(self) -> Dict[str, Any]:
         """
@@ -336,39 +681,47 @@ class ExcelProcessor:
         trends = {}
         
         # Para cada categoria, calcula tendências básicas
-        for category, df in self.financial_data.items():
-            numeric_cols = df.select_dtypes(include=['number']).columns
+        for category in self.financial_data:
+            columns = self._get_column_arrays(category)
             
-            if len(numeric_cols) < 2:
+            if len(columns) < 2:
                 continue
             
-            # Calcular estatísticas básicas
+            # Montar o bloco numérico diretamente a partir dos arrays das colunas
+            numeric_cols = pd.Index(list(columns))
+            block = np.empty((len(next(iter(columns.values()))), len(columns)))
+            for j, values in enumerate(columns.values()):
+                block[:, j] = values
+            
+            # Calcular estatísticas básicas (colunas sem valores resultam em NaN)
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", category=RuntimeWarning)
+                means = np.nanmean(block, axis=0)
+                medians = np.nanmedian(block, axis=0)
             category_trends = {
-                "media": df[numeric_cols].mean().to_dict(),
-                "mediana": df[numeric_cols].median().to_dict(),
+                "media": dict(zip(numeric_cols, means.tolist())),
+                "mediana": dict(zip(numeric_cols, medians.tolist())),
                 "tendencia": {},
                 "crescimento": {}
             }
             
-            # Calcular tendência (crescente, decrescente ou estável)
-            for col in numeric_cols:
-                values = df[col].dropna().values
-                if len(values) < 2:
-                    continue
-                
-                # Calcular taxa de crescimento
-                growth_rate = (values[-1] / values[0]) - 1 if values[0] != 0 else 0
-                category_trends["crescimento"][col] = growth_rate
-                
-                # Determinar tendência
-                if growth_rate > 0.05:  # Crescimento de mais de 5%
-                    trend = "crescente"
-                elif growth_rate < -0.05:  # Queda de mais de 5%
-                    trend = "decrescente"
-                else:
-                    trend = "estável"
-                
-                category_trends["tendencia"][col] = trend
+            # Sem ao menos duas linhas não há tendência a calcular
+            if block.shape[0] < 2:
+                trends[category] = category_trends
+                continue
+            
+            # Crescimento entre o primeiro e o último valor não nulo de cada coluna
+            growth, valid = _column_growth(block)
+            
+            # Determinar tendência: variação acima de 5% em qualquer sentido
+            trend = np.where(growth > 0.05, "crescente",
+                             np.where(growth < -0.05, "decrescente", "estável"))
+            
+            # Colunas com menos de dois valores não nulos ficam de fora
+            for col, col_growth, col_trend in zip(numeric_cols[valid], growth[valid].tolist(),
+                                                  trend[valid].tolist()):
+                category_trends["crescimento"][col] = col_growth
+                category_trends["tendencia"][col] = col_trend
             
             trends[category] = category_trends
         
@@ -378,6 +731,42 @@ class ExcelProcessor:
             "trends": trends
         }
 
+    def to_records(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Converte os dados financeiros em listas de registros serializáveis.
+        
+        A conversão é feita uma única vez, pelo caminho em C de to_dict, e
+        reaproveitada nas chamadas seguintes. Valores ausentes (NaN/NaT) viram
+        None, aceitos tanto em JSON quanto pelo MongoDB.
+        
+        Returns:
+            Dicionário categoria -> lista de registros (uma linha por registro).
+        """
+        if self._records is None:
+            self._records = {
+                category: self._dataframe_records(df) for category, df in self.financial_data.items()
+            }
+        return self._records
+    
+    @staticmethod
+    def _dataframe_records(df: pd.DataFrame) -> List[Dict[str, Any]]:
+        """
+        Converte um DataFrame em registros com tipos nativos do Python.
+        
+        Args:
+            df: DataFrame processado.
+            
+        Returns:
+            Lista de registros, com datas como datetime e ausentes como None.
+        """
+        values = df.astype(object)
+        
+        # Timestamp do pandas não é aceito por todos os serializadores JSON
+        for col in df.select_dtypes(include=["datetime"]).columns:
+            values[col] = pd.Series(df[col].dt.to_pydatetime(), index=df.index, dtype=object)
+        
+        return values.where(df.notna(), None).to_dict(orient="records")
+
     def _clean_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Realiza limpeza básica em um DataFrame.
@@ -496,7 +885,7 @@ class ExcelProcessor:
         e armazena os resultados no atributo metadata.
         """
         for category, data in self.financial_data.items():
-            numeric_columns = data.select_dtypes(include=['number']).columns.tolist()
+            numeric_columns = list(self._get_column_arrays(category))
             
             summary = {
                 "row_count": len(data),
@@ -70,7 +70,7 @@ FIELD_MAPPING = {
         "updatedAt": "updated_at",
         "role": "role",
         "isActive": "is_active",
-        "lastLogin": "last_login",
+        "lastLogin": "last_login_ts",
         "settings": "settings",
     },
     "financialData": {
@@ -102,13 +102,34 @@ FIELD_MAPPING = {
     }
 }
 
+def _login_timestamp(value: Any) -> int:
+    """
+    Converte a data do último login em segundos desde a época Unix.
+    
+    Datas sem fuso horário, como as devolvidas pelo pymongo sem tz_aware,
+    são interpretadas como UTC, e não no horário local da máquina.
+    
+    Args:
+        value: Data do último login (datetime ou texto ISO 8601) ou vazio.
+        
+    Returns:
+        Segundos desde a época Unix ou 0 se o usuário nunca fez login.
+    """
+    if not value:
+        return 0
+    if not isinstance(value, datetime.datetime):
+        value = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.timezone.utc)
+    return int(value.timestamp())
+
 # Campos que precisam de transformação especial
 TRANSFORM_FIELDS = {
     "users": {
         "password": migrate_password_hash,
         "createdAt": lambda x: x if isinstance(x, datetime.datetime) else datetime.datetime.fromisoformat(x.replace("Z", "+00:00")),
         "updatedAt": lambda x: x if isinstance(x, datetime.datetime) else datetime.datetime.fromisoformat(x.replace("Z", "+00:00")),
-        "lastLogin": lambda x: x if isinstance(x, datetime.datetime) else datetime.datetime.fromisoformat(x.replace("Z", "+00:00")) if x else None,
+        "lastLogin": _login_timestamp,
     },
     "financialData": {
         "date": lambda x: x if isinstance(x, datetime.datetime) else datetime.datetime.fromisoformat(x.replace("Z", "+00:00")),
@@ -5,8 +5,10 @@ Este módulo contém funções para gerenciamento de JWT, hashing de senhas,
 e dependências FastAPI para proteção de rotas.
 """
 
+import asyncio
+import time
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Sequence, Tuple, Union
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
@@ -67,6 +69,36 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    """
+    Versão assíncrona de ``verify_password`` executada em uma thread.
+    
+    O bcrypt é intencionalmente lento; rodá-lo fora do event loop evita que
+    uma verificação bloqueie as demais requisições.
+    
+    Args:
+        plain_password: Senha em texto plano.
+        hashed_password: Hash da senha armazenada.
+        
+    Returns:
+        bool: True se a senha corresponde ao hash, False caso contrário.
+    """
+    return await asyncio.to_thread(verify_password, plain_password, hashed_password)
+
+
+async def aget_password_hash(password: str) -> str:
+    """
+    Versão assíncrona de ``get_password_hash`` executada em uma thread.
+    
+    Args:
+        password: Senha em texto plano.
+        
+    Returns:
+        str: Hash da senha.
+    """
+    return await asyncio.to_thread(get_password_hash, password)
+
+
 # Funções para criação e validação de tokens JWT
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """
@@ -86,14 +118,14 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return encoded_jwt
 
 
-def create_user_token(user_id: str, role: str, permissions: List[str]) -> Dict[str, Any]:
+def create_user_token(user_id: str, role: str, permissions: Sequence[str]) -> Dict[str, Any]:
     """
     Cria um token JWT para um usuário específico.
     
     Args:
         user_id: ID do usuário.
         role: Papel do usuário.
-        permissions: Lista de permissões do usuário.
+        permissions: Sequência de permissões do usuário.
         
     Returns:
         Dict[str, Any]: Dados do token.
@@ -251,7 +283,11 @@ def check_resource_access(user: UserInDB, resource_owner_id: str) -> bool:
 class RateLimiter:
     """
     Implementação simples de limitação de taxa baseada em memória.
-    Em produção, seria recomendável usar Redis ou outro mecanismo distribuído.
+    
+    Usa uma janela fixa por chave (contador + expiração), o mesmo modelo de
+    ``INCR`` + ``EXPIRE`` do Redis, de modo que cada verificação é O(1).
+    Em produção com vários workers, seria recomendável usar Redis ou outro
+    mecanismo distribuído para compartilhar os contadores.
     """
     
     def __init__(self, max_attempts: int = 5, window_seconds: int = 60):
@@ -264,7 +300,9 @@ class RateLimiter:
         """
         self.max_attempts = max_attempts
         self.window_seconds = window_seconds
-        self.attempts = {}
+        # Chave -> (instante de expiração da janela, tentativas na janela)
+        self.attempts: Dict[str, Tuple[float, int]] = {}
+        self._next_cleanup = 0.0
         
     def is_rate_limited(self, key: str) -> bool:
         """
@@ -276,37 +314,33 @@ class RateLimiter:
         Returns:
             bool: True se a chave está limitada, False caso contrário.
         """
-        now = datetime.utcnow()
+        now = time.monotonic()
         
-        # Limpa tentativas antigas
-        self._clean_old_attempts(now)
+        # Limpa janelas expiradas no máximo uma vez por janela
+        if now >= self._next_cleanup:
+            self._clean_old_attempts(now)
         
-        # Verifica se a chave existe
-        if key not in self.attempts:
-            self.attempts[key] = []
-        
-        # Adiciona nova tentativa
-        self.attempts[key].append(now)
+        # Incrementa o contador, abrindo uma nova janela se a anterior expirou
+        expires_at, count = self.attempts.get(key, (0.0, 0))
+        if expires_at <= now:
+            expires_at, count = now + self.window_seconds, 0
+        count += 1
+        self.attempts[key] = (expires_at, count)
         
         # Verifica se excedeu o limite
-        return len(self.attempts[key]) > self.max_attempts
+        return count > self.max_attempts
         
-    def _clean_old_attempts(self, now: datetime):
+    def _clean_old_attempts(self, now: float):
         """
-        Remove tentativas antigas que estão fora da janela de tempo.
+        Remove chaves cuja janela de tempo já expirou.
         
         Args:
-            now: Hora atual.
+            now: Instante atual (``time.monotonic``).
         """
-        cutoff = now - timedelta(seconds=self.window_seconds)
-        
-        for key in list(self.attempts.keys()):
-            # Remove tentativas antigas
-            self.attempts[key] = [t for t in self.attempts[key] if t >= cutoff]
-            
-            # Remove entradas vazias
-            if not self.attempts[key]:
-                del self.attempts[key]
+        self.attempts = {
+            key: entry for key, entry in self.attempts.items() if entry[0] > now
+        }
+        self._next_cleanup = now + self.window_seconds
 
 # Instância global do limitador de taxa para login
 login_rate_limiter = RateLimiter(max_attempts=5, window_seconds=300)  # 5 tentativas a cada 5 minutos 
\ No newline at end of file
@@ -0,0 +1,68 @@
+"""
+Testes unitários das funções auxiliares do ExcelProcessor.
+
+Este módulo contém testes para as rotinas usadas no processamento das planilhas:
+identificação de categorias, detecção do formato das datas e cálculo de
+crescimento das colunas.
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+
+from app.utils.excel_processor import ExcelProcessor, FinancialCategory
+from app.utils.excel_processor import _column_growth_kernel, _column_growth_numpy
+
+
+@pytest.fixture
+def excel_processor():
+    """Fixture que cria uma instância do ExcelProcessor."""
+    return ExcelProcessor()
+
+
+@pytest.mark.parametrize("use_automaton", [True, False])
+def test_match_category_uses_category_order(excel_processor, monkeypatch, use_automaton):
+    """Testa se, com palavras-chave de duas categorias, prevalece a ordem de CATEGORY_KEYWORDS."""
+    if use_automaton:
+        if ExcelProcessor._KEYWORD_AUTOMATON is None:
+            pytest.skip("pyahocorasick não está instalado")
+    else:
+        # Força a busca pela expressão regular
+        monkeypatch.setattr(ExcelProcessor, "_KEYWORD_AUTOMATON", None)
+    
+    # "marketing" (despesas comerciais) aparece antes de "receita" no texto
+    df = pd.DataFrame(columns=["Data", "Marketing", "Receita liquida"])
+    assert excel_processor._identify_sheet_category("Planilha1", df) == FinancialCategory.REVENUE
+    
+    assert excel_processor._match_category("aluguel do escritório e salário") == FinancialCategory.PERSONNEL_EXPENSES
+    assert excel_processor._match_category("observações gerais") is None
+
+
+def test_detect_date_format(excel_processor):
+    """Testa a detecção do formato das colunas de data em texto."""
+    assert excel_processor._detect_date_format(pd.Series(["01/02/2024", "15/03/2024"])) == "%d/%m/%Y"
+    assert excel_processor._detect_date_format(pd.Series(["2024-01", None, "2024-02"])) == "%Y-%m"
+    assert excel_processor._detect_date_format(pd.Series(["2024-01-01", "Total", "2024-03-01"])) == "%Y-%m-%d"
+    
+    # Colunas numéricas ou sem formato reconhecido ficam sem formato
+    assert excel_processor._detect_date_format(pd.Series([1, 2, 3])) is None
+    assert excel_processor._detect_date_format(pd.Series(["foo", "bar"])) is None
+
+
+def test_column_growth_kernel_matches_numpy():
+    """Testa se o kernel em laços produz o mesmo crescimento da versão vetorizada."""
+    block = np.array([
+        [np.nan, 0.0, np.nan, 10.0],
+        [10.0, 5.0, np.nan, 9.0],
+        [12.0, 6.0, 3.0, 8.0],
+        [np.nan, 7.0, np.nan, 5.0]
+    ])
+    
+    growth, valid = _column_growth_numpy(block)
+    kernel_growth, kernel_valid = _column_growth_kernel(block)
+    
+    # Coluna com um único valor não nulo fica de fora
+    assert valid.tolist() == [True, True, False, True]
+    assert kernel_valid.tolist() == valid.tolist()
+    assert np.allclose(kernel_growth[valid], growth[valid])
+    assert np.allclose(growth[valid], [0.2, 0.0, -0.5])
@@ -0,0 +1,142 @@
+"""
+Testes unitários da geração de cenários sobre arrays por coluna.
+
+Este módulo contém testes para o ScenarioGenerator de app.services.scenario_generator,
+verificando a geração em lote, o cache de cenários e o recálculo das categorias
+derivadas.
+"""
+
+import pytest
+import pandas as pd
+
+from app.services import scenario_generator
+from app.services.scenario_generator import ScenarioGenerator, ScenarioType
+from app.utils.excel_processor import FinancialCategory
+
+
+@pytest.fixture(autouse=True)
+def clear_scenario_cache():
+    """Fixture que isola cada teste do cache de cenários do módulo."""
+    scenario_generator._SCENARIO_CACHE.clear()
+    yield
+    scenario_generator._SCENARIO_CACHE.clear()
+
+
+@pytest.fixture
+def financial_data():
+    """Fixture que cria dados financeiros com receitas, custos e despesas."""
+    return {
+        FinancialCategory.REVENUE.value: pd.DataFrame({
+            'Descrição': ['Produto A', 'Produto B'],
+            'Jan': [100.0, 200.0],
+            'Fev': [150.0, 250.0]
+        }),
+        FinancialCategory.VARIABLE_COSTS.value: pd.DataFrame({
+            'Descrição': ['Matéria Prima', 'Frete'],
+            'Jan': [30.0, 20.0],
+            'Fev': [40.0, 10.0]
+        }),
+        FinancialCategory.PERSONNEL_EXPENSES.value: pd.DataFrame({
+            'Descrição': ['Salários'],
+            'Jan': [50.0],
+            'Fev': [60.0]
+        }),
+        FinancialCategory.INVESTMENTS.value: pd.DataFrame({
+            'Descrição': ['Equipamentos'],
+            'Jan': [20.0],
+            'Fev': [10.0]
+        })
+    }
+
+
+def assert_scenarios_equal(result, expected):
+    """Compara os DataFrames e as métricas de duas respostas de cenário."""
+    assert result["scenario_type"] == expected["scenario_type"]
+    assert list(result["data"]) == list(expected["data"])
+    for category, df in expected["data"].items():
+        pd.testing.assert_frame_equal(result["data"][category], df)
+    assert result["metrics"] == pytest.approx(expected["metrics"])
+
+
+def test_generate_all_scenarios_matches_generate_scenario(financial_data):
+    """Testa se a geração em lote produz o mesmo resultado de cada tipo gerado isoladamente."""
+    param_overrides = {ScenarioType.PESSIMISTIC: {"revenue_adjustment": -0.2}}
+    
+    results = ScenarioGenerator().generate_all_scenarios(financial_data, param_overrides)
+    
+    assert tuple(results) == ScenarioType.ALL
+    
+    for scenario_type in ScenarioType.ALL:
+        # Cada tipo é gerado sem o cache preenchido pela geração em lote
+        scenario_generator._SCENARIO_CACHE.clear()
+        expected = ScenarioGenerator().generate_scenario(
+            financial_data, scenario_type, param_overrides.get(scenario_type)
+        )
+        assert_scenarios_equal(results[scenario_type], expected)
+
+
+def test_cached_scenario_is_not_affected_by_response_changes(financial_data):
+    """Testa se alterar a resposta de um cenário não altera as respostas seguintes do cache."""
+    first = ScenarioGenerator().generate_scenario(financial_data, ScenarioType.OPTIMISTIC)
+    expected = {
+        "scenario_type": first["scenario_type"],
+        "data": {category: df.copy() for category, df in first["data"].items()},
+        "metrics": dict(first["metrics"])
+    }
+    
+    # Altera a resposta recém-gerada, que também foi guardada no cache
+    first["data"][FinancialCategory.REVENUE.value].loc[0, 'Jan'] = -1.0
+    first["metrics"]["total_revenue"] = 0.0
+    
+    second = ScenarioGenerator().generate_scenario(financial_data, ScenarioType.OPTIMISTIC)
+    assert len(scenario_generator._SCENARIO_CACHE) == 1
+    assert_scenarios_equal(second, expected)
+    
+    # Altera uma resposta vinda do cache
+    second["data"][FinancialCategory.REVENUE.value].loc[1, 'Fev'] = -1.0
+    second["metrics"]["total_revenue"] = 0.0
+    
+    third = ScenarioGenerator().generate_scenario(financial_data, ScenarioType.OPTIMISTIC)
+    assert_scenarios_equal(third, expected)
+
+
+def test_derived_values_with_existing_derived_sheets(financial_data):
+    """Testa o recálculo das categorias derivadas quando os dados já trazem margem e fluxo de caixa."""
+    financial_data[FinancialCategory.CONTRIBUTION_MARGIN.value] = pd.DataFrame({
+        'Descrição': ['Margem 1', 'Margem 2'],
+        'Jan': [999.0, 999.0],
+        'Fev': [999.0, 999.0]
+    })
+    financial_data[FinancialCategory.CASH_FLOW.value] = pd.DataFrame({
+        'Descrição': ['Fluxo'],
+        'Jan': [5.0],
+        'Fev': [5.0]
+    })
+    
+    result = ScenarioGenerator().generate_scenario(financial_data, ScenarioType.REALISTIC)
+    data = result["data"]
+    
+    # Margem: receitas (300, 400) - custos variáveis (50, 50), dividida pelas 2 linhas
+    margin_df = data[FinancialCategory.CONTRIBUTION_MARGIN.value]
+    assert margin_df['Descrição'].tolist() == ['Margem 1', 'Margem 2']
+    assert margin_df['Jan'].tolist() == [125.0, 125.0]
+    assert margin_df['Fev'].tolist() == [175.0, 175.0]
+    
+    # Fluxo de caixa: margem (250, 350) - despesas fixas (50, 60), em uma linha
+    cashflow_df = data[FinancialCategory.CASH_FLOW.value]
+    assert cashflow_df['Descrição'].tolist() == ['Fluxo']
+    assert cashflow_df['Jan'].tolist() == [200.0]
+    assert cashflow_df['Fev'].tolist() == [290.0]
+    
+    # Saldo final: acumulado do fluxo (200, 490), nas 2 linhas do modelo
+    balance_df = data[FinancialCategory.FINAL_BALANCE.value]
+    assert balance_df['Descrição'].tolist() == ['Produto A', 'Produto B']
+    assert balance_df['Jan'].tolist() == [100.0, 100.0]
+    assert balance_df['Fev'].tolist() == [245.0, 245.0]
+    
+    assert result["metrics"]["total_margin"] == pytest.approx(600.0)
+    assert result["metrics"]["total_cashflow"] == pytest.approx(490.0)
+    
+    # Os dados de entrada não são alterados
+    assert financial_data[FinancialCategory.CONTRIBUTION_MARGIN.value]['Jan'].tolist() == [999.0, 999.0]
+    assert financial_data[FinancialCategory.CASH_FLOW.value]['Jan'].tolist() == [5.0]